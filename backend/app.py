@@ -13,12 +13,16 @@ import random
 import re
 import socket
 import struct
+import threading
 import time
+from bisect import bisect_left
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from core.register_blocks import RegisterBlockOrder
+
 try:
     from core.modbus_client import ModbusConnectionProfile, UnifiedModbusClient
     _MODBUS_AVAILABLE = True
@@ -67,6 +71,11 @@ _alert_id_counter: int = 1
 # ─── Modbus live polling state ─────────────────────────────────────────────────
 _modbus_client: Optional[Any] = None   # UnifiedModbusClient instance
 _poll_task: Optional[asyncio.Task] = None  # background asyncio Task
+# Last sensor state written by this process; readers share it instead of
+# re-reading sensor_state.json (None until the first write)
+_sensor_state: Optional[Dict[str, Any]] = None
+# Serialises sensor_state.json writes between the event loop and worker threads
+_sensor_state_file_lock = threading.Lock()
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
@@ -80,10 +89,44 @@ def _load_json(path: Path, default: Any = None) -> Any:
     return default if default is not None else []
 
 
+def _load_sensor_state() -> Dict[str, Any]:
+    """Return the latest sensor state as a copy the caller may modify.
+
+    Served from the in-memory snapshot once this process has written one,
+    otherwise from sensor_state.json (e.g. stale data from a previous run).
+    """
+    saved = _sensor_state
+    if saved is None:
+        saved = _load_json(SENSOR_STATE_FILE, {})
+    if saved.get("sensor_data"):
+        return {**saved, "sensor_data": dict(saved["sensor_data"])}
+    return dict(saved)
+
+
+def _store_sensor_state(data: Dict[str, Any]) -> None:
+    """Publish a new sensor state to readers (see _persist_sensor_state)."""
+    global _sensor_state
+    _sensor_state = data
+
+
+def _persist_sensor_state() -> bool:
+    """Write the current in-memory sensor state to sensor_state.json.
+
+    Always writes the latest snapshot, so a write left running by a
+    cancelled poll task cannot land stale data after a newer one.
+    """
+    with _sensor_state_file_lock:
+        return _save_json(SENSOR_STATE_FILE, _sensor_state or {})
+
+
 def _save_json(path: Path, data: Any) -> bool:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        # Write a temp file and rename it over the target, so readers never
+        # see a half-written file
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
         return True
     except Exception as exc:
         logger.error("Could not write %s: %s", path, exc)
@@ -195,8 +238,9 @@ def _enrich_sensor(sensor: Dict[str, Any]) -> Dict[str, Any]:
     _set("x_crest_factor", _r(15, 1000) or round(crest * 0.9, 3))
 
     # Aggregate / status
-    _set("rms_overall",   round(math.sqrt(z_rms**2 + x_rms**2), 3))
-    _set("energy",        round((z_rms**2 + x_rms**2) * 100, 1))
+    sum_sq = z_rms * z_rms + x_rms * x_rms
+    _set("rms_overall",   round(math.sqrt(sum_sq), 3))
+    _set("energy",        round(sum_sq * 100, 1))
     _set("bearing_health", float(sensor.get("bearing_health", 0.0)))
     _set("humidity",      0.0)
     _set("vibration_trend", 0.0)
@@ -212,31 +256,38 @@ def _enrich_sensor(sensor: Dict[str, Any]) -> Dict[str, Any]:
     return sensor
 
 
+# Bound once so the demo generator's ~25 draws per sample skip the module lookup
+_uniform = random.uniform
+_sin = math.sin
+
+
 def _generate_demo_sensor() -> Dict[str, Any]:
     """Synthetic oscillating data — ONLY used when demo mode is explicitly on.
 
     All 21 register-mapped fields are present (addresses 45201-45221).
     in/sec values are derived from mm/s using 1 in = 25.4 mm.
+    The clock is read once; uptime and timestamp are derived from it.
     """
     t = time.time()
-    base_z = 1.8 + 0.8 * math.sin(t * 0.3) + random.uniform(-0.1, 0.1)
-    base_x = 1.4 + 0.6 * math.sin(t * 0.4 + 1.0) + random.uniform(-0.1, 0.1)
-    temp_c = 38.5 + 2.0 * math.sin(t * 0.05) + random.uniform(-0.2, 0.2)
-    kurtosis_val = 3.2 + 1.5 * abs(math.sin(t * 0.15)) + random.uniform(-0.1, 0.1)
+    base_z = 1.8 + 0.8 * _sin(t * 0.3) + _uniform(-0.1, 0.1)
+    base_x = 1.4 + 0.6 * _sin(t * 0.4 + 1.0) + _uniform(-0.1, 0.1)
+    temp_c = 38.5 + 2.0 * _sin(t * 0.05) + _uniform(-0.2, 0.2)
+    kurtosis_val = 3.2 + 1.5 * abs(_sin(t * 0.15)) + _uniform(-0.1, 0.1)
 
     z_rms = round(max(0.1, base_z), 3)
     x_rms = round(max(0.1, base_x), 3)
-    z_peak = round(z_rms * 1.42 + random.uniform(-0.05, 0.05), 3)
-    x_peak = round(x_rms * 1.42 + random.uniform(-0.05, 0.05), 3)
-    z_accel = round(z_rms * 0.65 + random.uniform(-0.05, 0.05), 3)
-    x_accel = round(x_rms * 0.55 + random.uniform(-0.05, 0.05), 3)
-    z_kurtosis = round(kurtosis_val + random.uniform(-0.05, 0.05), 3)
-    x_kurtosis = round(kurtosis_val * 0.9 + random.uniform(-0.05, 0.05), 3)
-    z_crest = round(z_kurtosis * 0.85 + random.uniform(-0.05, 0.05), 3)
-    x_crest = round(x_kurtosis * 0.85 + random.uniform(-0.05, 0.05), 3)
-    freq_z = round(9.5 + random.uniform(-0.5, 0.5), 1)
-    freq_x = round(11.2 + random.uniform(-0.5, 0.5), 1)
+    z_peak = round(z_rms * 1.42 + _uniform(-0.05, 0.05), 3)
+    x_peak = round(x_rms * 1.42 + _uniform(-0.05, 0.05), 3)
+    z_accel = round(z_rms * 0.65 + _uniform(-0.05, 0.05), 3)
+    x_accel = round(x_rms * 0.55 + _uniform(-0.05, 0.05), 3)
+    z_kurtosis = round(kurtosis_val + _uniform(-0.05, 0.05), 3)
+    x_kurtosis = round(kurtosis_val * 0.9 + _uniform(-0.05, 0.05), 3)
+    z_crest = round(z_kurtosis * 0.85 + _uniform(-0.05, 0.05), 3)
+    x_crest = round(x_kurtosis * 0.85 + _uniform(-0.05, 0.05), 3)
+    freq_z = round(9.5 + _uniform(-0.5, 0.5), 1)
+    freq_x = round(11.2 + _uniform(-0.5, 0.5), 1)
     temperature = round(temp_c, 1)
+    sum_sq = z_rms * z_rms + x_rms * x_rms
 
     return {
         "z_rms": z_rms, "x_rms": x_rms,
@@ -246,31 +297,43 @@ def _generate_demo_sensor() -> Dict[str, Any]:
         "z_peak_vel_in": round(z_peak / 25.4, 4), "x_peak_vel_in": round(x_peak / 25.4, 4),
         "z_accel": z_accel, "x_accel": x_accel,
         "z_rms_accel": z_accel, "x_rms_accel": x_accel,
-        "z_peak_accel": round(z_accel * 1.45 + random.uniform(-0.03, 0.03), 3),
-        "x_peak_accel": round(x_accel * 1.45 + random.uniform(-0.03, 0.03), 3),
-        "z_hf_rms_accel": round(z_accel * 0.35 + random.uniform(-0.01, 0.01), 3),
+        "z_peak_accel": round(z_accel * 1.45 + _uniform(-0.03, 0.03), 3),
+        "x_peak_accel": round(x_accel * 1.45 + _uniform(-0.03, 0.03), 3),
+        "z_hf_rms_accel": round(z_accel * 0.35 + _uniform(-0.01, 0.01), 3),
         "temperature": temperature, "temp_f": round(temperature * 9 / 5 + 32, 1),
         "z_peak_freq": freq_z, "x_peak_freq": freq_x,
         "kurtosis": round(kurtosis_val, 3),
         "z_kurtosis": z_kurtosis, "x_kurtosis": x_kurtosis,
         "crest_factor": z_crest, "z_crest_factor": z_crest, "x_crest_factor": x_crest,
-        "rms_overall": round(math.sqrt(z_rms**2 + x_rms**2), 3),
-        "energy": round((z_rms**2 + x_rms**2) * 100, 1),
-        "bearing_health": round(max(50, min(100, 95 - kurtosis_val * 2 + random.uniform(-1, 1))), 1),
+        "rms_overall": round(math.sqrt(sum_sq), 3),
+        "energy": round(sum_sq * 100, 1),
+        "bearing_health": round(max(50, min(100, 95 - kurtosis_val * 2 + _uniform(-1, 1))), 1),
         "iso_class": "B" if z_rms < 2.3 else ("C" if z_rms < 4.5 else "D"),
         "alarm_status": "normal" if z_rms < 2.8 else ("warning" if z_rms < 4.0 else "alarm"),
-        "humidity": round(45 + random.uniform(-3, 3), 1),
+        "humidity": round(45 + _uniform(-3, 3), 1),
         "frequency": freq_z,
-        "vibration_trend": round(random.uniform(-0.02, 0.02), 4),
-        "temp_trend": round(random.uniform(-0.01, 0.01), 4),
-        "uptime": int(time.time() - _state["connect_time"]) if _state.get("connect_time") else 0,
+        "vibration_trend": round(_uniform(-0.02, 0.02), 4),
+        "temp_trend": round(_uniform(-0.01, 0.01), 4),
+        "uptime": int(t - _state["connect_time"]) if _state.get("connect_time") else 0,
         "sensor_status": "demo", "data_quality": 98,
         "peak_accel": round(max(z_accel, x_accel) * 1.2, 3),
         "peak_velocity": round(max(z_rms, x_rms) * 1.05, 3),
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": datetime.fromtimestamp(t, timezone.utc).isoformat(),
     }
 
 
+# ISO 10816 zone upper limits (mm/s, inclusive) and the zone each one closes;
+# the final entry covers everything above the last limit.
+_ISO_ZONE_LIMITS = (1.8, 4.5, 7.1, 11.2)
+_ISO_ZONES = (
+    ("A", "green",  "Very good — new machinery"),
+    ("B", "green",  "Good — new machines in this zone"),
+    ("C", "yellow", "Acceptable — damaged machines in this zone"),
+    ("D", "orange", "Warning — check bearings & alignment"),
+    ("E", "red",    "Danger — immediate maintenance required"),
+)
+
+
 def _rule_based_ml(sensor: Dict[str, Any]) -> Dict[str, Any]:
     """Simple rule-based ML prediction derived from sensor values."""
     z_rms = sensor.get("z_rms", 0.0)
@@ -300,16 +363,8 @@ def _rule_based_ml(sensor: Dict[str, Any]) -> Dict[str, Any]:
     cls_name      = "anomaly" if is_anomaly else "normal"
 
     # ISO severity
-    if z_rms <= 1.8:
-        iso_lvl, iso_cls, iso_color, iso_desc = "A", "A", "green", "Very good — new machinery"
-    elif z_rms <= 4.5:
-        iso_lvl, iso_cls, iso_color, iso_desc = "B", "B", "green", "Good — new machines in this zone"
-    elif z_rms <= 7.1:
-        iso_lvl, iso_cls, iso_color, iso_desc = "C", "C", "yellow", "Acceptable — damaged machines in this zone"
-    elif z_rms <= 11.2:
-        iso_lvl, iso_cls, iso_color, iso_desc = "D", "D", "orange", "Warning — check bearings & alignment"
-    else:
-        iso_lvl, iso_cls, iso_color, iso_desc = "E", "E", "red",    "Danger — immediate maintenance required"
+    iso_lvl, iso_color, iso_desc = _ISO_ZONES[bisect_left(_ISO_ZONE_LIMITS, z_rms)]
+    iso_cls = iso_lvl
 
     return {
         "ml": {
@@ -341,7 +396,7 @@ def _build_ws_payload() -> Dict[str, Any]:
       4. Idle / no data at all            → all-zero idle payload.
     """
     if _state["connected"]:
-        saved = _load_json(SENSOR_STATE_FILE, {})
+        saved = _load_sensor_state()
         if saved.get("sensor_data"):
             sensor = saved["sensor_data"]
             sensor = _enrich_sensor(sensor)
@@ -368,7 +423,7 @@ def _build_ws_payload() -> Dict[str, Any]:
         # Not connected — show last known data as stale so pages don't go OFFLINE
         # while auto-reconnect is in progress.  Only show idle (zeros) if there
         # is truly no prior data at all.
-        saved = _load_json(SENSOR_STATE_FILE, {})
+        saved = _load_sensor_state()
         if saved.get("sensor_data"):
             sensor = saved["sensor_data"]
             sensor = _enrich_sensor(sensor)
@@ -397,8 +452,9 @@ def _build_ws_payload() -> Dict[str, Any]:
             "rms_velocity": 0.0,
         }
 
+    now_iso = datetime.now(timezone.utc).isoformat()
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": now_iso,
         "sensor_data": sensor,
         "features": {
             "z_rms": z_rms,
@@ -415,9 +471,7 @@ def _build_ws_payload() -> Dict[str, Any]:
             "baud": _state["baud"],
             "slave_id": _state["slave_id"],
             "uptime_seconds": _state["uptime_seconds"],
-            "last_poll": _state.get("last_poll") or (
-                datetime.now(timezone.utc).isoformat() if device_connected else None
-            ),
+            "last_poll": _state.get("last_poll") or (now_iso if device_connected else None),
             "packet_loss": _state["packet_loss"],
             "auto_reconnect": _state["auto_reconnect"],
         },
@@ -444,6 +498,12 @@ def _build_ws_payload() -> Dict[str, Any]:
 _REG_ADDR_PRIMARY = 5200    # DXM primary Modbus address block
 _REG_ADDR_FALLBACK = 0      # Fallback address block (some DXM firmware)
 _REG_COUNT = 22
+# Divisors for R0–R19, in register order (see map above)
+_REG_DIVISORS = (
+    100.0, 1000.0, 1000.0, 100.0, 1000.0, 1000.0, 1000.0, 1000.0, 10.0, 10.0,
+    1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0,
+)
+_REG_SCALED_COUNT = len(_REG_DIVISORS)
 
 
 def _registers_to_sensor(regs: List[int], read_source: str = "unknown") -> Dict[str, Any]:
@@ -451,40 +511,25 @@ def _registers_to_sensor(regs: List[int], read_source: str = "unknown") -> Dict[
 
     Register map matches data_receiver.py exactly.
     """
-    def _g(idx: int, div: float = 1.0) -> float:
-        try:
-            return round(regs[idx] / div, 4) if idx < len(regs) else 0.0
-        except Exception:
-            return 0.0
-
     def _signed(val: float) -> float:
         """Convert unsigned 16-bit encoded signed value (÷100)."""
         return val - 655.36 if val > 327.67 else val
 
-    z_axis_rms    = _g(0,  100.0)
-    z_rms         = _g(1,  1000.0)
-    iso_peak_peak = _g(2,  1000.0)
-    temperature   = _signed(_g(3, 100.0))
-    z_true_peak   = _g(4,  1000.0)
-    x_rms         = _g(5,  1000.0)
-    z_peak_accel  = _g(6,  1000.0)
-    x_peak_accel  = _g(7,  1000.0)
-    z_peak_freq   = _g(8,  10.0)
-    x_peak_freq   = _g(9,  10.0)
-    z_band_rms    = _g(10, 1000.0)
-    x_band_rms    = _g(11, 1000.0)
-    z_kurtosis    = _g(12, 1000.0)
-    x_kurtosis    = _g(13, 1000.0)
-    z_crest       = _g(14, 1000.0)
-    x_crest       = _g(15, 1000.0)
-    z_hf_rms      = _g(16, 1000.0)
-    z_peak_vel    = _g(17, 1000.0)
-    x_hf_rms      = _g(18, 1000.0)
-    x_peak_vel    = _g(19, 1000.0)
+    # Scale R0–R19 in one pass; short reads are zero-padded
+    padded = list(regs[:_REG_SCALED_COUNT])
+    padded.extend([0] * (_REG_SCALED_COUNT - len(padded)))
+    (
+        z_axis_rms, z_rms, iso_peak_peak, temperature, z_true_peak, x_rms,
+        z_peak_accel, x_peak_accel, z_peak_freq, x_peak_freq,
+        z_band_rms, x_band_rms, z_kurtosis, x_kurtosis, z_crest, x_crest,
+        z_hf_rms, z_peak_vel, x_hf_rms, x_peak_vel,
+    ) = [round(raw / div, 4) for raw, div in zip(padded, _REG_DIVISORS)]
+    temperature = _signed(temperature)
     device_status = int(regs[20]) if len(regs) > 20 else 0
 
     temp_f      = round(temperature * 9 / 5 + 32, 1)
-    rms_overall = round(math.sqrt(z_rms**2 + x_rms**2), 3)
+    sum_sq      = z_rms * z_rms + x_rms * x_rms
+    rms_overall = round(math.sqrt(sum_sq), 3)
     connect_t   = _state.get("connect_time") or time.time()
 
     return {
@@ -532,7 +577,7 @@ def _registers_to_sensor(regs: List[int], read_source: str = "unknown") -> Dict[
         "device_status":   device_status,
         # Derived / aggregate
         "rms_overall":     rms_overall,
-        "energy":          round((z_rms**2 + x_rms**2) * 100, 1),
+        "energy":          round(sum_sq * 100, 1),
         "bearing_health":  round(max(0.0, min(100.0, 100.0 - (z_rms * 10.0))), 1),
         "iso_class":       "B" if z_rms < 2.3 else ("C" if z_rms < 4.5 else "D"),
         "alarm_status":    "normal" if z_rms < 2.8 else ("warning" if z_rms < 4.0 else "alarm"),
@@ -556,6 +601,8 @@ async def _modbus_poll_loop() -> None:
     """Background task: poll DXM Modbus registers at 1 Hz and save to sensor_state.json.
 
     Tries address 5200 first (DXM primary block), falls back to address 0.
+    Address 0 is only tried first after 5200 has come back empty for several
+    consecutive cycles, and 5200 is re-probed periodically (RegisterBlockOrder).
     Auto-reconnects when the DXM drops the TCP connection (which it does periodically).
     Only marks connected=False after 30 consecutive failures with no successful reconnect.
     """
@@ -563,6 +610,7 @@ async def _modbus_poll_loop() -> None:
     consecutive_failures = 0
     reconnect_attempts = 0
     read_source = "5200"
+    block_order = RegisterBlockOrder(_REG_ADDR_PRIMARY, _REG_ADDR_FALLBACK)
     logger.info("Modbus poll loop started (will try addr=5200 then addr=0)")
 
     while _state["connected"] and _modbus_client:
@@ -591,18 +639,22 @@ async def _modbus_poll_loop() -> None:
                         await asyncio.sleep(2.0)
                         continue
 
-            # Try primary address (DXM Modbus block)
-            regs = await _modbus_client.read_holding_registers(
-                address=_REG_ADDR_PRIMARY, count=_REG_COUNT, slave_id=slave_id
-            )
-            read_source = "5200"
-
-            # Fallback to address 0 if primary returns nothing or all zeros
-            if regs is None or all(r == 0 for r in regs):
-                regs = await _modbus_client.read_holding_registers(
-                    address=_REG_ADDR_FALLBACK, count=_REG_COUNT, slave_id=slave_id
+            # Preferred block first, so firmware that only populates
+            # address 0 costs one round-trip instead of two. As before, the
+            # last block tried is the result: an all-zero block only stands
+            # if the other read also returned a block, otherwise the poll
+            # counts as a failure.
+            regs = None
+            data_addr = None
+            for addr in block_order.order:
+                block = await _modbus_client.read_holding_registers(
+                    address=addr, count=_REG_COUNT, slave_id=slave_id
                 )
-                read_source = "0"
+                regs, read_source = block, str(addr)
+                if any(block):
+                    data_addr = addr
+                    break
+            block_order.record(data_addr)
 
             if regs is not None:
                 sensor = _registers_to_sensor(regs, read_source)
@@ -612,10 +664,12 @@ async def _modbus_poll_loop() -> None:
                 consecutive_failures = 0
                 reconnect_attempts = 0
 
-                _save_json(SENSOR_STATE_FILE, {
-                    "last_updated": sensor["timestamp"],
-                    "sensor_data": sensor,
-                })
+                # Readers get the new state from memory straight away; the
+                # file write runs off the event loop so API handlers aren't
+                # stalled behind it (and never see a half-written file)
+                state = {"last_updated": sensor["timestamp"], "sensor_data": sensor}
+                _store_sensor_state(state)
+                await asyncio.to_thread(_persist_sensor_state)
                 logger.info(
                     "Poll OK [addr=%s]: z_rms=%.3f x_rms=%.3f temp=%.1f°C nz=%d",
                     read_source, sensor["z_rms"], sensor["x_rms"],
@@ -713,7 +767,8 @@ async def _start_modbus_connection(req_data: Dict[str, Any]) -> Dict[str, Any]:
         _state["uptime_seconds"] = 0
         _state["packet_loss"] = 0.0
         # Clear stale sensor state so WS shows "connecting" until first real poll
-        _save_json(SENSOR_STATE_FILE, {})
+        _store_sensor_state({})
+        await asyncio.to_thread(_persist_sensor_state)
         _poll_task = asyncio.create_task(_modbus_poll_loop())
         logger.info("Connected to %s — poll loop started", port_label)
         return {"success": True, "message": f"Connected to {port_label} and polling started"}
@@ -1212,7 +1267,7 @@ async def get_data_batch(limit: int = Query(100, ge=1, le=10000)):
 
 @app.get("/api/v1/metrics")
 async def get_metrics():
-    saved = _load_json(SENSOR_STATE_FILE, {})
+    saved = _load_sensor_state()
     sensor = saved.get("sensor_data", {})
     return {
         "uptime": _state["uptime_seconds"],
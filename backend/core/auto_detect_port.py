@@ -154,7 +154,7 @@ async def auto_detect_modbus_port(
             }
         else:
             reason = result.get("reason", "unknown")
-            logger.debug(f"   {port}: probe failed ({reason})")
+            logger.debug("   %s: probe failed (%s)", port, reason)
 
     # No sensor found
     logger.warning(
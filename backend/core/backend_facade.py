@@ -56,7 +56,9 @@ class BackendFacade:
         await self.connection_manager.disconnect(manual=True)
 
     def get_status(self) -> Dict[str, Any]:
-        return self.connection_manager.get_status()
+        status = self.connection_manager.get_status()
+        status["receiver"] = self.data_receiver.get_stats()
+        return status
 
     async def get_live_data(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
         try:
@@ -65,11 +67,12 @@ class BackendFacade:
             return None
 
     async def notify_connection_success(self) -> None:
+        status = self.get_status()
         await self.realtime_stream.broadcast(
             {
                 "event": "connection_success",
-                "timestamp": self.get_status().get("last_poll"),
-                "connection_status": self.get_status(),
+                "timestamp": status.get("last_poll"),
+                "connection_status": status,
             }
         )
 
@@ -157,7 +157,13 @@ class ConnectionManager:
                 if self.profile is None or not self.client.is_connected():
                     continue
 
-                healthy = await self.client.heartbeat()
+                # A data read inside the last interval already proved the link;
+                # skip the extra round-trip on the shared bus
+                now = datetime.now(timezone.utc)
+                healthy = (
+                    self.last_successful_read is not None
+                    and (now - self.last_successful_read).total_seconds() < self.HEARTBEAT_INTERVAL
+                ) or await self.client.heartbeat()
                 if healthy:
                     failures = 0
                     self.last_heartbeat = datetime.now(timezone.utc)
@@ -187,8 +193,10 @@ class ConnectionManager:
         return self.client.is_connected()
 
     def get_status(self) -> Dict[str, Any]:
+        # Ask the client once; it re-derives the flag from the socket each time
+        connected = self.is_connected()
         uptime_seconds = 0
-        if self.connected_at and self.is_connected():
+        if self.connected_at and connected:
             uptime_seconds = int((datetime.now(timezone.utc) - self.connected_at).total_seconds())
 
         port_value = None
@@ -203,7 +211,7 @@ class ConnectionManager:
             slave_id = self.profile.slave_id
 
         return {
-            "connected": self.is_connected(),
+            "connected": connected,
             "port": port_value,
             "baud": baud,
             "slave_id": slave_id,
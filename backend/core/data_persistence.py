@@ -3,6 +3,7 @@ Data persistence for maintaining chart data across tab navigation
 """
 import json
 import os
+from collections import deque
 from datetime import datetime, timezone
 from typing import Dict, List, Any
 from pathlib import Path
@@ -22,8 +23,8 @@ class DataPersistence:
         # Maximum data points to keep
         self.max_points = 2000 # Increased for better history
         
-        # Memory Cache
-        self._chart_cache: List[Dict[str, Any]] = self.load_chart_data()
+        # Memory Cache: bounded ring buffer, oldest points fall off on append
+        self._chart_cache: deque = deque(self.load_chart_data(), maxlen=self.max_points)
         self._last_save_time = datetime.now()
         self._save_interval = 30 # Seconds
         
@@ -32,10 +33,6 @@ class DataPersistence:
         try:
             self._chart_cache.append(chart_data_point)
             
-            # Keep only the latest data points
-            if len(self._chart_cache) > self.max_points:
-                self._chart_cache = self._chart_cache[-self.max_points:]
-            
             # Flush to disk if interval passed or requested immediate
             now = datetime.now()
             if immediate or (now - self._last_save_time).total_seconds() >= self._save_interval:
@@ -50,7 +47,7 @@ class DataPersistence:
         try:
             data = {
                 "last_updated": datetime.now(timezone.utc).isoformat(),
-                "data_points": self._chart_cache
+                "data_points": list(self._chart_cache)
             }
             with open(self.chart_data_file, "w", encoding="utf-8") as f:
                 json.dump(data, f) # Removed indent for smaller file size & speed
@@ -72,8 +69,8 @@ class DataPersistence:
             return []
             
     def get_buffered_chart_data(self) -> List[Dict[str, Any]]:
-        """Return current in-memory cache"""
-        return self._chart_cache
+        """Return a snapshot of the current in-memory cache"""
+        return list(self._chart_cache)
     
     def save_sensor_state(self, sensor_data: Dict[str, Any]):
         """Save current sensor state (lightweight)"""
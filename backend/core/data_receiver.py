@@ -3,14 +3,24 @@
 import asyncio
 import logging
 import math
+import struct
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .connection_manager import ConnectionManager
+from .register_blocks import RegisterBlockOrder
 
 logger = logging.getLogger(__name__)
 
+_WORD_PAIR_BE = struct.Struct(">HH")
+_FLOAT32_BE = struct.Struct(">f")
+
+
+def _signed(value: float) -> float:
+    """Fold a scaled unsigned 16-bit temperature back into its signed range"""
+    return value - 655.36 if value > 327.67 else value
+
 
 class DataReceiver:
     """Continuously polls DXM registers and emits normalized packets."""
@@ -23,6 +33,10 @@ class DataReceiver:
         self.data_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=256)
         self.error_count = 0
         self.max_errors_before_reconnect = 3
+        self._block_order = RegisterBlockOrder()
+        self._decode_cache: Optional[Tuple[Tuple[Tuple[int, ...], str], Dict[str, Any]]] = None
+        self.decode_cache_hits = 0
+        self.decode_cache_misses = 0
 
     async def start(self) -> None:
         if self._running:
@@ -39,6 +53,14 @@ class DataReceiver:
             except asyncio.CancelledError:
                 pass
 
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.decode_cache_hits + self.decode_cache_misses
+        return {
+            "decode_cache_hits": self.decode_cache_hits,
+            "decode_cache_misses": self.decode_cache_misses,
+            "decode_cache_hit_rate": round(self.decode_cache_hits / lookups * 100.0, 2) if lookups else 0.0,
+        }
+
     async def _emit_packet(self, packet: Dict[str, Any]) -> None:
         if self.data_queue.full():
             try:
@@ -92,58 +114,74 @@ class DataReceiver:
 
         slave_id = self.cm.profile.slave_id
         
-        # Try primary register range (5200 = Modbus 45201-45222) first
-        registers = await self.cm.client.read_holding_registers(address=5200, count=22, slave_id=slave_id)
-        read_source = "5200"
-        
-        # Fallback: try registers 0-21 if primary range fails or returns all zeros
-        if not registers or all(r == 0 for r in registers):
-            logger.debug("Primary registers (5200) empty, trying fallback registers (0-21)")
-            registers = await self.cm.client.read_holding_registers(address=0, count=22, slave_id=slave_id)
-            read_source = "0"
+        # Primary range is 5200 (Modbus 45201-45222), fallback is registers 0-21.
+        # The preferred block is read first, so a device that only populates
+        # one of them normally costs a single read per cycle. The last block
+        # tried is the result, so an all-zero block only stands if the other
+        # read also returned one; otherwise the cycle counts as a failure.
+        registers = None
+        data_address = None
+        read_source = str(self._block_order.primary)
+        for address in self._block_order.order:
+            block = await self.cm.client.read_holding_registers(address=address, count=22, slave_id=slave_id)
+            registers, read_source = block, str(address)
+            if any(block):
+                data_address = address
+                break
+        self._block_order.record(data_address)
         
         if not registers:
             return None
 
-        def get_reg(index: int, divisor: float = 1.0) -> float:
-            if index >= len(registers):
-                return 0.0
-            return registers[index] / divisor
-
-        def signed(value: float) -> float:
-            return value - 655.36 if value > 327.67 else value
+        # Consecutive polls often return identical registers; reuse the last
+        # decode then (callers get their own copy of the dict)
+        key = (tuple(registers), read_source)
+        cached = self._decode_cache
+        if cached is not None and cached[0] == key:
+            self.decode_cache_hits += 1
+            return dict(cached[1])
+        self.decode_cache_misses += 1
+        data = self._decode_registers(registers, read_source)
+        self._decode_cache = (key, data)
+        return dict(data)
+
+    @staticmethod
+    def _decode_registers(registers: List[int], read_source: str) -> Dict[str, Any]:
+        # Zero-pad short reads once instead of bounds-checking every register
+        regs = registers
+        if len(regs) < 20:
+            regs = list(regs) + [0] * (20 - len(regs))
 
         # Try to decode register pair 20-21 as IEEE 754 float32 (big-endian)
         float32_val = 0.0
         if len(registers) >= 22 and (registers[20] != 0 or registers[21] != 0):
-            import struct
             try:
-                float32_val = struct.unpack('>f', struct.pack('>HH', registers[20], registers[21]))[0]
+                float32_val = _FLOAT32_BE.unpack(_WORD_PAIR_BE.pack(registers[20], registers[21]))[0]
             except Exception:
                 float32_val = 0.0
 
         # R0-R20: decode all 21 physical parameters
-        z_axis_rms     = get_reg(0,  100.0)          # R0  Z-Axis RMS (g)
-        z_rms_mm       = get_reg(1,  1000.0)          # R1  Z-RMS velocity mm/s
-        iso_peak_peak  = get_reg(2,  1000.0)          # R2  ISO Peak-Peak mm/s
-        temperature    = signed(get_reg(3, 100.0))    # R3  Temperature °C
-        z_true_peak    = get_reg(4,  1000.0)          # R4  Z-True Peak mm/s
-        x_rms_mm       = get_reg(5,  1000.0)          # R5  X-RMS velocity mm/s
-        z_peak_accel   = get_reg(6,  1000.0)          # R6  Z-Peak Acceleration g
-        x_peak_accel   = get_reg(7,  1000.0)          # R7  X-Peak Acceleration g
-        z_peak_freq    = get_reg(8,  10.0)            # R8  Z-Peak Frequency Hz
-        x_peak_freq    = get_reg(9,  10.0)            # R9  X-Peak Frequency Hz
-        z_band_rms     = get_reg(10, 1000.0)          # R10 Z-Band RMS mm/s
-        x_band_rms     = get_reg(11, 1000.0)          # R11 X-Band RMS mm/s
-        z_kurtosis     = get_reg(12, 1000.0)          # R12 Z-Kurtosis
-        x_kurtosis     = get_reg(13, 1000.0)          # R13 X-Kurtosis
-        z_crest        = get_reg(14, 1000.0)          # R14 Z-Crest Factor
-        x_crest        = get_reg(15, 1000.0)          # R15 X-Crest Factor
-        z_hf_rms_accel = get_reg(16, 1000.0)          # R16 Z-Envelope/HF RMS g
-        z_peak_vel_mm  = get_reg(17, 1000.0)          # R17 Z-Peak velocity mm/s
-        x_hf_rms_accel = get_reg(18, 1000.0)          # R18 X-Envelope/HF RMS g
-        x_peak_vel_mm  = get_reg(19, 1000.0)          # R19 X-Peak velocity mm/s
-        device_status  = get_reg(20, 1.0)             # R20 Device Status code
+        z_axis_rms     = regs[0] / 100.0            # R0  Z-Axis RMS (g)
+        z_rms_mm       = regs[1] / 1000.0           # R1  Z-RMS velocity mm/s
+        iso_peak_peak  = regs[2] / 1000.0           # R2  ISO Peak-Peak mm/s
+        temperature    = _signed(regs[3] / 100.0)   # R3  Temperature °C
+        z_true_peak    = regs[4] / 1000.0           # R4  Z-True Peak mm/s
+        x_rms_mm       = regs[5] / 1000.0           # R5  X-RMS velocity mm/s
+        z_peak_accel   = regs[6] / 1000.0           # R6  Z-Peak Acceleration g
+        x_peak_accel   = regs[7] / 1000.0           # R7  X-Peak Acceleration g
+        z_peak_freq    = regs[8] / 10.0             # R8  Z-Peak Frequency Hz
+        x_peak_freq    = regs[9] / 10.0             # R9  X-Peak Frequency Hz
+        z_band_rms     = regs[10] / 1000.0          # R10 Z-Band RMS mm/s
+        x_band_rms     = regs[11] / 1000.0          # R11 X-Band RMS mm/s
+        z_kurtosis     = regs[12] / 1000.0          # R12 Z-Kurtosis
+        x_kurtosis     = regs[13] / 1000.0          # R13 X-Kurtosis
+        z_crest        = regs[14] / 1000.0          # R14 Z-Crest Factor
+        x_crest        = regs[15] / 1000.0          # R15 X-Crest Factor
+        z_hf_rms_accel = regs[16] / 1000.0          # R16 Z-Envelope/HF RMS g
+        z_peak_vel_mm  = regs[17] / 1000.0          # R17 Z-Peak velocity mm/s
+        x_hf_rms_accel = regs[18] / 1000.0          # R18 X-Envelope/HF RMS g
+        x_peak_vel_mm  = regs[19] / 1000.0          # R19 X-Peak velocity mm/s
+        device_status  = registers[20] if len(registers) > 20 else 0  # R20 Device Status code (raw int)
 
         non_zero_count = sum(1 for r in registers if r != 0)
 
@@ -174,7 +212,7 @@ class DataReceiver:
             "x_band_rms":      round(x_band_rms, 3),
             "z_hf_rms_accel":  round(z_hf_rms_accel, 4),
             "x_hf_rms_accel":  round(x_hf_rms_accel, 4),
-            "device_status":   int(device_status),
+            "device_status":   device_status,
             # Derived
             "rms_overall":     round(math.sqrt(z_rms_mm ** 2 + x_rms_mm ** 2), 3),
             "bearing_health":  round(max(0.0, min(100.0, 100.0 - (z_rms_mm * 10.0))), 1),
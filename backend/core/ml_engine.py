@@ -79,7 +79,6 @@ class MLEngine:
     
     async def _create_default_model(self):
         """Create a default trained model using synthetic 5-class data"""
-        np.random.seed(42)
         rng = np.random.default_rng(42)
 
         def bounded(mean, std, lo, hi, n):
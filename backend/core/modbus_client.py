@@ -11,7 +11,7 @@ from pymodbus.exceptions import ModbusException
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModbusConnectionProfile:
     protocol: str
     slave_id: int = 1
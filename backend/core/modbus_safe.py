@@ -7,12 +7,14 @@ import asyncio
 import logging
 import math
 import random
+import time
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from collections import deque
+from itertools import islice
 from pymodbus.client import ModbusTcpClient, ModbusSerialClient
-from pymodbus.exceptions import ModbusException
+from pymodbus.exceptions import ModbusException, ModbusIOException
 import serial.tools.list_ports
 import serial
 from .advanced_logger import advanced_logger
@@ -44,6 +46,26 @@ class ModbusClient:
     # SAFE REGISTER BLOCK - ONLY THESE REGISTERS
     START_REGISTER = 45201
     NUM_REGISTERS = 22  # Registers 45201-45222 (note: 45217 is included)
+    START_ADDRESS = START_REGISTER - 40001  # Zero-based PDU address (5200)
+    
+    # Divisor per register, in block order:
+    #   45201 Z RMS velocity (in/sec)      45202 Z RMS velocity (mm/sec)
+    #   45203 Temperature (°F, signed)     45204 Temperature (°C, signed)
+    #   45205 X RMS velocity (in/sec)      45206 X RMS velocity (mm/sec)
+    #   45207 Z peak acceleration (G)      45208 X peak acceleration (G)
+    #   45209 Z peak velocity freq (Hz)    45210 X peak velocity freq (Hz)
+    #   45211 Z RMS acceleration (G)       45212 X RMS acceleration (G)
+    #   45213 Z kurtosis                   45214 X kurtosis
+    #   45215 Z crest factor               45216 X crest factor
+    #   45217 Z peak velocity (in/sec)     45218 Z peak velocity (mm/sec)
+    #   45219 X peak velocity (in/sec)     45220 X peak velocity (mm/sec)
+    #   45221 Z HF RMS acceleration (G)    45222 X HF RMS acceleration (G)
+    _REGISTER_SCALES = (
+        10000.0, 1000.0, 100.0, 100.0, 10000.0, 1000.0,
+        1000.0, 1000.0, 10.0, 10.0,
+        1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0,
+        10000.0, 1000.0, 10000.0, 1000.0, 1000.0, 1000.0,
+    )
     
     # Circuit breaker settings - increased tolerance for transient errors
     FAILURE_THRESHOLD = 15  # Open circuit after 15 consecutive failures (was 5)
@@ -53,6 +75,9 @@ class ModbusClient:
     # Error rate limiting
     MAX_ERROR_LOG_RATE = 1  # Log detailed error max once per second
     
+    # Reconnect pause follows retry_delay but never exceeds this (seconds)
+    RECONNECT_MAX_DELAY = 2.0
+    
     # Advanced monitoring settings
     PERFORMANCE_WINDOW = 100  # Track last 100 readings for analytics
     ANOMALY_THRESHOLD = 2.5  # Standard deviations for anomaly detection
@@ -124,6 +149,7 @@ class ModbusClient:
         self.circuit_open_time: Optional[datetime] = None
         self.last_error_log: Optional[datetime] = None
         self._zero_reading_count = 0  # Track consecutive zero readings
+        self._link_reset_tried = False  # Buffer purge used for the current outage
         
     def _update_analytics(self, sensor_data: Dict[str, Any]):
         """Update advanced analytics with new sensor data"""
@@ -150,8 +176,11 @@ class ModbusClient:
                 
                 # Calculate trend (linear regression over last N points)
                 if len(self.historical_data) >= self.PREDICTIVE_WINDOW:
-                    recent_data = [d['data'][key] for d in list(self.historical_data)[-self.PREDICTIVE_WINDOW:] 
-                                  if key in d['data'] and isinstance(d['data'][key], (int, float))]
+                    # History entries all come from read_safe_registers, so
+                    # their numeric fields need no per-item type check
+                    start = len(self.historical_data) - self.PREDICTIVE_WINDOW
+                    recent_data = [d['data'][key] for d in islice(self.historical_data, start, None)
+                                   if key in d['data']]
                     if len(recent_data) >= 2:
                         # Simple linear trend calculation
                         x = list(range(len(recent_data)))
@@ -183,8 +212,8 @@ class ModbusClient:
                 
                 # Calculate standard deviation from historical data
                 if len(self.historical_data) >= 10:
-                    values = [d['data'][key] for d in list(self.historical_data)[-20:] 
-                              if key in d['data'] and isinstance(d['data'][key], (int, float))]
+                    values = [d['data'][key] for d in islice(reversed(self.historical_data), 20)
+                              if key in d['data']]
                     
                     if len(values) >= 5:
                         mean_val = sum(values) / len(values)
@@ -413,12 +442,12 @@ class ModbusClient:
             return True
         except (OSError, PermissionError, serial.SerialException) as e:
             if "Access is denied" in str(e) or "Permission denied" in str(e):
-                logger.debug(f"Port {port} is in use or access denied: {e}")
+                logger.debug("Port %s is in use or access denied: %s", port, e)
             else:
-                logger.debug(f"Port {port} not available: {e}")
+                logger.debug("Port %s not available: %s", port, e)
             return False
         except Exception as e:
-            logger.debug(f"Error checking port {port}: {e}")
+            logger.debug("Error checking port %s: %s", port, e)
             return False
     
     def _should_log_error(self) -> bool:
@@ -440,12 +469,13 @@ class ModbusClient:
         self.suppressed_error_count += 1
         return False
     
-    def _record_success(self):
+    def _record_success(self, now: Optional[datetime] = None):
         """Record successful read and reset circuit breaker"""
         had_failures = self.consecutive_failures > 0
         self.consecutive_failures = 0
         self.retry_delay = 1.0
-        self.last_success_time = datetime.now()
+        self.last_success_time = now or datetime.now()
+        self._link_reset_tried = False
         
         if self.circuit_state == CircuitState.HALF_OPEN:
             logger.info("✅ Connection recovered - Circuit breaker CLOSED")
@@ -500,15 +530,39 @@ class ModbusClient:
         
         return False
     
+    def _reset_link(self) -> bool:
+        """Drop stale bytes on the open serial port; False if it isn't open"""
+        port = getattr(self.client, "socket", None) if self.client else None
+        if port is None or not getattr(port, "is_open", False):
+            return False
+        try:
+            port.reset_input_buffer()
+            port.reset_output_buffer()
+        except (OSError, serial.SerialException):
+            return False
+        self.connected = True
+        return True
+    
     async def _attempt_reconnect(self) -> bool:
         """Attempt to reconnect to Modbus device"""
         if not self.auto_reconnect or not self.port:
             return False
         
+        # First try after an outage: purge the port buffers and carry on; only
+        # reopen the port if that didn't bring the device back
+        if not self._link_reset_tried and self._reset_link():
+            self._link_reset_tried = True
+            logger.info(f"🔄 Purged serial buffers on {self.port}, retrying without reopening")
+            return True
+        self._link_reset_tried = False
+        
         logger.info(f"🔄 Attempting to reconnect to {self.port}...")
         try:
             await self.disconnect()
-            await asyncio.sleep(2)  # Wait before reconnect
+            # Short exponential backoff with jitter so retries don't lock step
+            # with the device's own recovery
+            delay = min(self.retry_delay, self.RECONNECT_MAX_DELAY)
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
             success = await self.connect(self.port, self.baud, self.slave_id)
             if success:
                 logger.info(f"✅ Reconnected to {self.port}")
@@ -540,33 +594,25 @@ class ModbusClient:
         
         try:
             # Track response time for connection quality monitoring
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             
-            # Read 21 registers starting at 45201
-            address_to_read = self.START_REGISTER - 40001
-            
-            logger.debug(f"Reading Modbus registers from address {address_to_read}")
+            # Read 22 registers starting at 45201
+            logger.debug("Reading Modbus registers from address %d", self.START_ADDRESS)
             
             result = self.client.read_holding_registers(
-                address=address_to_read,
+                address=self.START_ADDRESS,
                 count=self.NUM_REGISTERS,
                 slave=self.slave_id
             )
             
             # Calculate response time
-            response_time = (datetime.now() - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
             self.response_times.append(response_time)
             
-            # Keep only last 100 response times
-            if len(self.response_times) > 100:
-                # Convert to list, slice, then back to deque
-                response_list = list(self.response_times)
-                self.response_times = deque(response_list[-100:], maxlen=self.PERFORMANCE_WINDOW)
-            
             # Update connection quality based on response times
+            # (the deque's maxlen already bounds the window)
             if len(self.response_times) > 10:
-                response_list = list(self.response_times)
-                avg_response_time = sum(response_list[-10:]) / 10
+                avg_response_time = sum(islice(reversed(self.response_times), 10)) / 10
                 # Quality decreases with slower response times
                 self.connection_quality = max(0, min(100, 100 - (avg_response_time - 0.5) * 20))
             
@@ -580,7 +626,7 @@ class ModbusClient:
             
             # Parse registers
             registers = result.registers
-            logger.debug(f"Read {len(registers)} registers")
+            logger.debug("Read %d registers", len(registers))
             
             # Check if all values are zero (likely connection issue)
             # Only fail after multiple consecutive zero readings to avoid false positives
@@ -599,84 +645,30 @@ class ModbusClient:
                     self._zero_reading_count = 0  # Reset counter
                     return None
                 else:
-                    # Skip this reading but don't count as failure
-                    logger.debug(f"Zero reading {self._zero_reading_count}/3, will retry")
-                    await asyncio.sleep(0.2)
+                    # Skip this reading but don't count as failure; the
+                    # caller's poll interval already spaces out the retry
+                    logger.debug("Zero reading %d/3, will retry", self._zero_reading_count)
                     return None
             else:
                 # Reset zero reading counter on successful data
                 self._zero_reading_count = 0
             
-            # Scale values according to actual Modbus specifications
-            # Register 45201: Z-Axis RMS Velocity (in/sec) - Scale 1, Range 0-6.5535
-            z_rms_in = registers[0] / 10000.0 if len(registers) > 0 else 0.0
-            
-            # Register 45202: Z-Axis RMS Velocity (mm/sec) - Scale 2, Range 0-65.535
-            z_rms_mm = registers[1] / 1000.0 if len(registers) > 1 else 0.0
-            
-            # Register 45203: Temperature (°F) - Scale 3, Range -327.68 to 327.67
-            temp_f = registers[2] / 100.0 if len(registers) > 2 else 0.0
+            # Scale the whole block in one pass (see _REGISTER_SCALES for the
+            # per-register map); short reads are zero-padded
+            padded = list(registers[:self.NUM_REGISTERS])
+            padded.extend([0] * (self.NUM_REGISTERS - len(padded)))
+            (z_rms_in, z_rms_mm, temp_f, temperature, x_rms_in, x_rms_mm,
+             z_peak_accel, x_peak_accel, z_peak_freq, x_peak_freq,
+             z_rms_accel, x_rms_accel, z_kurtosis, x_kurtosis,
+             z_crest_factor, x_crest_factor, z_peak_vel_in, z_peak_vel_mm,
+             x_peak_vel_in, x_peak_vel_mm, z_hf_rms_accel, x_hf_rms_accel,
+             ) = [raw / scale for raw, scale in zip(padded, self._REGISTER_SCALES)]
+
+            # Temperatures are signed 16-bit values (Range -327.68 to 327.67)
             if temp_f > 327.67:
-                temp_f = temp_f - 655.36  # Handle negative values
-            
-            # Register 45204: Temperature (°C) - Scale 3, Range -327.68 to 327.67
-            temperature = registers[3] / 100.0 if len(registers) > 3 else 0.0
+                temp_f = temp_f - 655.36
             if temperature > 327.67:
-                temperature = temperature - 655.36  # Handle negative values
-            
-            # Register 45205: X-Axis RMS Velocity (in/sec) - Scale 1, Range 0-6.5535
-            x_rms_in = registers[4] / 10000.0 if len(registers) > 4 else 0.0
-            
-            # Register 45206: X-Axis RMS Velocity (mm/sec) - Scale 2, Range 0-65.535
-            x_rms_mm = registers[5] / 1000.0 if len(registers) > 5 else 0.0
-            
-            # Register 45207: Z-Axis Peak Acceleration (G) - Scale 2, Range 0-65.535
-            z_peak_accel = registers[6] / 1000.0 if len(registers) > 6 else 0.0
-            
-            # Register 45208: X-Axis Peak Acceleration (G) - Scale 2, Range 0-65.535
-            x_peak_accel = registers[7] / 1000.0 if len(registers) > 7 else 0.0
-            
-            # Register 45209: Z-Axis Peak Velocity Component Frequency (Hz) - Scale 4, Range 0-6553.5
-            z_peak_freq = registers[8] / 10.0 if len(registers) > 8 else 0.0
-            
-            # Register 45210: X-Axis Peak Velocity Component Frequency (Hz) - Scale 4, Range 0-6553.5
-            x_peak_freq = registers[9] / 10.0 if len(registers) > 9 else 0.0
-            
-            # Register 45211: Z-Axis RMS Acceleration (G) - Scale 2, Range 0-65.535
-            z_rms_accel = registers[10] / 1000.0 if len(registers) > 10 else 0.0
-            
-            # Register 45212: X-Axis RMS Acceleration (G) - Scale 2, Range 0-65.535
-            x_rms_accel = registers[11] / 1000.0 if len(registers) > 11 else 0.0
-            
-            # Register 45213: Z-Axis Kurtosis - Scale 2, Range 0-65.535
-            z_kurtosis = registers[12] / 1000.0 if len(registers) > 12 else 0.0
-            
-            # Register 45214: X-Axis Kurtosis - Scale 2, Range 0-65.535
-            x_kurtosis = registers[13] / 1000.0 if len(registers) > 13 else 0.0
-            
-            # Register 45215: Z-Axis Crest Factor - Scale 2, Range 0-65.535
-            z_crest_factor = registers[14] / 1000.0 if len(registers) > 14 else 0.0
-            
-            # Register 45216: X-Axis Crest Factor - Scale 2, Range 0-65.535
-            x_crest_factor = registers[15] / 1000.0 if len(registers) > 15 else 0.0
-            
-            # Register 45217: Z-Axis Peak Velocity (in/sec) - Scale 1, Range 0-6.5535
-            z_peak_vel_in = registers[16] / 10000.0 if len(registers) > 16 else 0.0
-            
-            # Register 45218: Z-Axis Peak Velocity (mm/sec) - Scale 2, Range 0-65.535
-            z_peak_vel_mm = registers[17] / 1000.0 if len(registers) > 17 else 0.0
-            
-            # Register 45219: X-Axis Peak Velocity (in/sec) - Scale 1, Range 0-6.5535
-            x_peak_vel_in = registers[18] / 10000.0 if len(registers) > 18 else 0.0
-            
-            # Register 45220: X-Axis Peak Velocity (mm/sec) - Scale 2, Range 0-65.535
-            x_peak_vel_mm = registers[19] / 1000.0 if len(registers) > 19 else 0.0
-            
-            # Register 45221: Z-Axis HF RMS Acceleration (G) - Scale 2, Range 0-65.535
-            z_hf_rms_accel = registers[20] / 1000.0 if len(registers) > 20 else 0.0
-            
-            # Register 45222: X-Axis HF RMS Acceleration (G) - Scale 2, Range 0-65.535
-            x_hf_rms_accel = registers[21] / 1000.0 if len(registers) > 21 else 0.0
+                temperature = temperature - 655.36
             
             # Log success (but not every time to reduce noise)
             if self.consecutive_failures > 0 or (self.total_polls % 20 == 0):
@@ -685,7 +677,7 @@ class ModbusClient:
             self.last_poll = datetime.now()
             self.total_polls += 1
             self.successful_polls += 1
-            self._record_success()
+            self._record_success(self.last_poll)
             
             # Create sensor data dictionary
             sensor_data = {
@@ -754,8 +746,9 @@ class ModbusClient:
             self._record_failure()
             
             # Only mark as disconnected after repeated communication errors
-            # to avoid premature disconnection on transient errors
-            if "No response" in str(e) or "Input/Output" in str(e):
+            # to avoid premature disconnection on transient errors. No-response
+            # and other I/O failures all raise ModbusIOException ("[Input/Output]")
+            if isinstance(e, ModbusIOException):
                 if self.consecutive_failures >= 10:  # Only disconnect after 10 failures
                     self.connected = False
                     logger.warning(f"Marking connection as lost after {self.consecutive_failures} failures")
@@ -783,9 +776,8 @@ class ModbusClient:
         # Calculate average response time
         avg_response_time = 0.0
         if self.response_times:
-            # Convert deque to list for slicing
-            response_list = list(self.response_times)
-            avg_response_time = sum(response_list[-10:]) / min(10, len(response_list))
+            recent = min(10, len(self.response_times))
+            avg_response_time = sum(islice(reversed(self.response_times), recent)) / recent
         
         return {
             "connected": self.connected,
@@ -804,6 +796,6 @@ class ModbusClient:
             "suppressed_errors": self.suppressed_error_count,
             "connection_quality": round(self.connection_quality, 1),
             "avg_response_time": round(avg_response_time, 3),
-            "last_response_times": list(self.response_times)[-5:] if self.response_times else []
+            "last_response_times": list(islice(self.response_times, max(0, len(self.response_times) - 5), None))
         }
 
@@ -75,16 +75,17 @@ class RealtimeStream:
                 if self.active_connections:
                     message = json.dumps(packet)
 
-                    disconnected_clients = []
-                    for connection in list(self.active_connections):
-                        try:
-                            await connection.send_text(message)
-                        except Exception as e:
-                            logger.debug(f"Send failed: {e}")
-                            disconnected_clients.append(connection)
-                            
-                    for dc in disconnected_clients:
-                        self.disconnect(dc)
+                    # Send to every client concurrently so one slow socket
+                    # doesn't hold up the rest of the fan-out
+                    connections = list(self.active_connections)
+                    results = await asyncio.gather(
+                        *(connection.send_text(message) for connection in connections),
+                        return_exceptions=True,
+                    )
+                    for connection, result in zip(connections, results):
+                        if isinstance(result, Exception):
+                            logger.debug("Send failed: %s", result)
+                            self.disconnect(connection)
                         
             except asyncio.CancelledError:
                 break
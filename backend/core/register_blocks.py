@@ -0,0 +1,56 @@
+"""
+Register block selection for the vibration sensor.
+
+The sensor publishes its 22 registers at 5200 (Modbus 45201-45222); some
+firmware only populates the block at address 0 instead. Pollers read the
+preferred block first and fall back to the other one.
+"""
+from typing import Optional, Tuple
+
+PRIMARY_BLOCK = 5200
+FALLBACK_BLOCK = 0
+
+
+class RegisterBlockOrder:
+    """
+    Decide which register block a poller reads first.
+
+    A single all-zero read of the primary block is a normal transient, so
+    the primary is only demoted after DEMOTE_AFTER consecutive polls where
+    the fallback had data and the primary did not. While demoted, the
+    primary is still tried first every REPROBE_EVERY polls, so it is picked
+    up again once the device populates it.
+    """
+
+    DEMOTE_AFTER = 3
+    REPROBE_EVERY = 50
+
+    def __init__(self, primary: int = PRIMARY_BLOCK, fallback: int = FALLBACK_BLOCK):
+        self.primary = primary
+        self.fallback = fallback
+        self._misses = 0
+        self._demoted = False
+        self._polls_since_demotion = 0
+
+    @property
+    def order(self) -> Tuple[int, int]:
+        """Addresses to try this poll, preferred block first"""
+        if self._demoted and self._polls_since_demotion % self.REPROBE_EVERY:
+            return (self.fallback, self.primary)
+        return (self.primary, self.fallback)
+
+    def record(self, address: Optional[int]) -> None:
+        """Record which block returned non-zero data this poll (None if neither)"""
+        if address == self.primary:
+            self._misses = 0
+            self._demoted = False
+        elif address == self.fallback and not self._demoted:
+            self._misses += 1
+            if self._misses >= self.DEMOTE_AFTER:
+                self._demoted = True
+                self._polls_since_demotion = 0
+        elif address is None:
+            # A poll with no data at all breaks the streak
+            self._misses = 0
+        if self._demoted:
+            self._polls_since_demotion += 1
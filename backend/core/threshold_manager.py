@@ -116,20 +116,16 @@ ALERT_COOLDOWN_SECONDS = 30  # Reduced cooldown as we now use hysteresis
 HYSTERESIS_FACTOR = 0.05      # 5% hysteresis for industrial stability
 
 
+# Parameters that can carry thresholds; each maps to the sensor key of the same name
+_THRESHOLD_PARAMETERS = frozenset(
+    ('z_rms', 'x_rms', 'temperature', 'z_accel', 'x_accel', 'kurtosis')
+)
+
+
 def _get_sensor_value(parameter: str, sensor_data: dict) -> Optional[float]:
     """Map a parameter key to its current sensor value."""
-    if parameter == 'z_rms':
-        return sensor_data.get('z_rms', 0)
-    if parameter == 'x_rms':
-        return sensor_data.get('x_rms', 0)
-    if parameter == 'temperature':
-        return sensor_data.get('temperature', 0)
-    if parameter == 'z_accel':
-        return sensor_data.get('z_accel', 0)
-    if parameter == 'x_accel':
-        return sensor_data.get('x_accel', 0)
-    if parameter == 'kurtosis':
-        return sensor_data.get('kurtosis', 0)
+    if parameter in _THRESHOLD_PARAMETERS:
+        return sensor_data.get(parameter, 0)
     return None
 
 def load_thresholds() -> List[ThresholdConfig]:
@@ -22,8 +22,8 @@ def create_directories():
 def check_python_version():
     """Check Python version"""
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print(f"[ERROR] Python 3.8+ required. Current: {version.major}.{version.minor}")
+    if version.major < 3 or (version.major == 3 and version.minor < 10):
+        print(f"[ERROR] Python 3.10+ required. Current: {version.major}.{version.minor}")
         return False
     print(f"[OK] Python {version.major}.{version.minor}.{version.micro}")
     return True
@@ -73,8 +73,17 @@ class ConnectionHealth:
     successful_reads: int = 0
     avg_response_time: float = 0.0
     response_times: deque = field(default_factory=lambda: deque(maxlen=100))
+    response_time_sum: float = 0.0
     error_count: int = 0
     failovers: int = 0
+    
+    def add_response_time(self, seconds: float) -> None:
+        """Append to the rolling window, keeping its running sum current"""
+        window = self.response_times
+        if len(window) == window.maxlen:
+            self.response_time_sum -= window[0]
+        window.append(seconds)
+        self.response_time_sum += seconds
 
 
 class DualModbusClient:
@@ -86,6 +95,22 @@ class DualModbusClient:
     # Safe register block for QM30VT2
     START_REGISTER = 45201
     NUM_REGISTERS = 22
+    START_ADDRESS = START_REGISTER - 40001  # Zero-based PDU address (5200)
+    
+    # Failed failovers before reads stop trying the other link; re-armed by a
+    # successful read or the next health check
+    MAX_FAILOVER_ATTEMPTS = 3
+    
+    # Frontend alias -> decoded field it mirrors
+    _FIELD_ALIASES = (
+        ("z_peak", "z_peak_vel_mm"),
+        ("x_peak", "x_peak_vel_mm"),
+        ("z_accel", "z_peak_accel"),
+        ("x_accel", "x_peak_accel"),
+        ("kurtosis", "z_kurtosis"),
+        ("crest_factor", "z_crest_factor"),
+        ("frequency", "z_peak_freq"),
+    )
     
     def __init__(self, device_id: str, config: ConnectionConfig):
         self.device_id = device_id
@@ -101,6 +126,7 @@ class DualModbusClient:
         self._reconnect_delay = config.reconnect_delay
         self._running = False
         self._health_check_task: Optional[asyncio.Task] = None
+        self._failover_attempts = 0  # Failed failovers in the current outage
         
         # Callbacks
         self._on_data: Optional[Callable[[Dict[str, Any]], None]] = None
@@ -263,94 +289,94 @@ class DualModbusClient:
         Read Modbus registers with automatic failover.
         Returns parsed sensor data or None on failure.
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        async with self._lock:
-            result = None
-            
-            # Try current connection first
-            if self._current_connection == ConnectionType.TCP:
-                result = await self._read_tcp()
-                if result is None and self.config.failover_enabled:
-                    result = await self._failover_to_serial()
-            else:
-                result = await self._read_serial()
-                if result is None and self.config.failover_enabled:
-                    result = await self._failover_to_tcp()
-            
-            # Update health metrics
-            response_time = time.time() - start_time
-            self.health.response_times.append(response_time)
-            self.health.total_reads += 1
+        # Only transport access is serialised (see _read_tcp/_read_serial);
+        # failover reconnects take the lock themselves
+        result = None
+        
+        # Try current connection first; once the other link has refused a few
+        # failovers this outage, don't pay its connect timeout on every read
+        try_failover = (self.config.failover_enabled
+                        and self._failover_attempts < self.MAX_FAILOVER_ATTEMPTS)
+        if self._current_connection == ConnectionType.TCP:
+            result = await self._read_tcp()
+            if result is None and try_failover:
+                result = await self._failover_to_serial()
+        else:
+            result = await self._read_serial()
+            if result is None and try_failover:
+                result = await self._failover_to_tcp()
+        
+        # Update health metrics
+        response_time = time.monotonic() - start_time
+        self.health.add_response_time(response_time)
+        self.health.total_reads += 1
+        now = datetime.now()
+        
+        if result:
+            self._failover_attempts = 0
+            self.health.successful_reads += 1
+            self.health.last_success = now
+            self.health.consecutive_failures = 0
+            self.health.avg_response_time = self.health.response_time_sum / len(self.health.response_times)
             
-            if result:
-                self.health.successful_reads += 1
-                self.health.last_success = datetime.now()
-                self.health.consecutive_failures = 0
-                self.health.avg_response_time = sum(self.health.response_times) / len(self.health.response_times)
-                
-                if self.health.state != ConnectionState.CONNECTED:
-                    self.health.state = ConnectionState.CONNECTED
-                    if self._on_status_change:
-                        await asyncio.to_thread(self._on_status_change, ConnectionState.CONNECTED)
-            else:
-                self.health.consecutive_failures += 1
-                self.health.last_failure = datetime.now()
-                
-                # Degrade state after threshold
-                if self.health.consecutive_failures >= self.config.failover_threshold:
-                    self.health.state = ConnectionState.DEGRADED
-                    if self._on_status_change:
-                        await asyncio.to_thread(self._on_status_change, ConnectionState.DEGRADED)
+            if self.health.state != ConnectionState.CONNECTED:
+                self.health.state = ConnectionState.CONNECTED
+                if self._on_status_change:
+                    await asyncio.to_thread(self._on_status_change, ConnectionState.CONNECTED)
+        else:
+            self.health.consecutive_failures += 1
+            self.health.last_failure = now
             
-            return result
+            # Degrade state after threshold
+            if self.health.consecutive_failures >= self.config.failover_threshold:
+                self.health.state = ConnectionState.DEGRADED
+                if self._on_status_change:
+                    await asyncio.to_thread(self._on_status_change, ConnectionState.DEGRADED)
+        
+        return result
     
     async def _read_tcp(self) -> Optional[Dict[str, Any]]:
         """Read registers via TCP"""
         if not self.tcp_client or not self.tcp_client.is_socket_open():
             return None
         
-        try:
-            address = self.START_REGISTER - 40001
-            result = self.tcp_client.read_holding_registers(
-                address=address,
-                count=self.NUM_REGISTERS,
-                slave=self.config.slave_id
-            )
-            
-            if result and not result.isError():
-                return self._parse_registers(result.registers)
-            return None
-            
-        except ModbusException as e:
-            logger.debug(f"[{self.device_id}] TCP read error: {e}")
-            return None
-        except Exception as e:
-            logger.debug(f"[{self.device_id}] TCP read exception: {e}")
-            return None
+        # Shielded so a caller's timeout cannot release _lock while the
+        # worker thread is still inside the (non-thread-safe) client
+        return await asyncio.shield(self._read_locked(self.tcp_client, "TCP"))
     
     async def _read_serial(self) -> Optional[Dict[str, Any]]:
         """Read registers via Serial"""
         if not self.serial_client or not self.serial_client.is_socket_open():
             return None
         
+        # Shielded so a caller's timeout cannot release _lock while the
+        # worker thread is still inside the (non-thread-safe) client
+        return await asyncio.shield(self._read_locked(self.serial_client, "Serial"))
+    
+    async def _read_locked(self, client, kind: str) -> Optional[Dict[str, Any]]:
+        """Read the register block on a worker thread, holding _lock until it returns"""
         try:
-            address = self.START_REGISTER - 40001
-            result = self.serial_client.read_holding_registers(
-                address=address,
-                count=self.NUM_REGISTERS,
-                slave=self.config.slave_id
-            )
+            # Blocking pymodbus call runs in a worker thread so that the
+            # manager's gather() overlaps reads across devices
+            async with self._lock:
+                result = await asyncio.to_thread(
+                    client.read_holding_registers,
+                    address=self.START_ADDRESS,
+                    count=self.NUM_REGISTERS,
+                    slave=self.config.slave_id
+                )
             
             if result and not result.isError():
                 return self._parse_registers(result.registers)
             return None
             
         except ModbusException as e:
-            logger.debug(f"[{self.device_id}] Serial read error: {e}")
+            logger.debug("[%s] %s read error: %s", self.device_id, kind, e)
             return None
         except Exception as e:
-            logger.debug(f"[{self.device_id}] Serial read exception: {e}")
+            logger.debug("[%s] %s read exception: %s", self.device_id, kind, e)
             return None
     
     async def _failover_to_serial(self) -> Optional[Dict[str, Any]]:
@@ -368,6 +394,7 @@ class DualModbusClient:
             return await self._read_serial()
         
         logger.error(f"[{self.device_id}] Failover to Serial failed")
+        self._failover_attempts += 1
         return None
     
     async def _failover_to_tcp(self) -> Optional[Dict[str, Any]]:
@@ -383,6 +410,7 @@ class DualModbusClient:
             return await self._read_tcp()
         
         logger.error(f"[{self.device_id}] Failover to TCP failed")
+        self._failover_attempts += 1
         return None
     
     def _parse_registers(self, registers: List[int]) -> Dict[str, Any]:
@@ -416,15 +444,6 @@ class DualModbusClient:
             "z_hf_rms_accel": round(registers[20] / 1000.0, 3),  # Z-Axis HF RMS Acceleration (G)
             "x_hf_rms_accel": round(registers[21] / 1000.0, 3),  # X-Axis HF RMS Acceleration (G)
             
-            # Aliases for frontend compatibility
-            "z_peak": round(registers[17] / 1000.0, 3),
-            "x_peak": round(registers[19] / 1000.0, 3),
-            "z_accel": round(registers[6] / 1000.0, 3),
-            "x_accel": round(registers[7] / 1000.0, 3),
-            "kurtosis": round(registers[12] / 1000.0, 3),
-            "crest_factor": round(registers[14] / 1000.0, 3),
-            "frequency": round(registers[8] / 10.0, 1),
-            
             # Metadata
             "device_id": self.device_id,
             "timestamp": datetime.now().isoformat(),
@@ -432,6 +451,10 @@ class DualModbusClient:
             "raw_registers": registers
         }
         
+        # Aliases for frontend compatibility
+        for alias, source in self._FIELD_ALIASES:
+            data[alias] = data[source]
+        
         return data
     
     @staticmethod
@@ -462,6 +485,8 @@ class DualModbusClient:
                 
                 # Attempt to reconnect to primary if in fallback
                 elif self.health.state == ConnectionState.DEGRADED or self.health.state == ConnectionState.FAILED:
+                    # Give reads another round of failover attempts each interval
+                    self._failover_attempts = 0
                     logger.info(f"[{self.device_id}] Attempting to restore primary connection")
                     if self.config.primary_connection == ConnectionType.TCP:
                         if await self._connect_tcp():
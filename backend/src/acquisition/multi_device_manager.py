@@ -24,9 +24,9 @@ class DeviceInfo:
     config: ConnectionConfig = field(default_factory=ConnectionConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedData:
-    """Unified data packet from all devices"""
+    """Unified data packet from all devices (one per poll cycle, slotted)"""
     timestamp: str
     devices: Dict[str, Any]
     aggregated: Dict[str, Any]
@@ -52,9 +52,9 @@ class MultiDXMManager:
         self._on_unified_data: Optional[Callable[[UnifiedData], None]] = None
         self._on_device_error: Optional[Callable[[str, Exception], None]] = None
         
-        # Data buffer
+        # Data buffer - never mutated in place, only replaced by a new dict,
+        # so readers always see a complete snapshot without taking a lock
         self._latest_data: Dict[str, Any] = {}
-        self._data_lock = asyncio.Lock()
         
         logger.info("MultiDXMManager initialized")
     
@@ -92,8 +92,7 @@ class MultiDXMManager:
         # Remove from tracking
         del self.devices[device_id]
         del self.device_info[device_id]
-        if device_id in self._latest_data:
-            del self._latest_data[device_id]
+        self._latest_data = {k: v for k, v in self._latest_data.items() if k != device_id}
         
         logger.info(f"Device {device_id} unregistered")
         return True
@@ -172,9 +171,9 @@ class MultiDXMManager:
                         device_data[device_id] = result
                         healthy_count += 1
                 
-                # Update latest data
-                async with self._data_lock:
-                    self._latest_data.update(device_data)
+                # Publish the new snapshot of latest data
+                if device_data:
+                    self._latest_data = {**self._latest_data, **device_data}
                 
                 # Create unified data packet
                 unified = self._create_unified_data(device_data, healthy_count)
@@ -297,10 +296,10 @@ class MultiDXMManager:
         }
     
     def get_latest_data(self, device_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Get latest data for one or all devices"""
+        """Get latest data for one or all devices (the shared snapshot; treat as read-only)"""
         if device_id:
             return self._latest_data.get(device_id)
-        return dict(self._latest_data)
+        return self._latest_data
     
     def set_poll_interval(self, interval: float):
         """Set polling interval in seconds"""
@@ -212,7 +212,7 @@ class AlertManager:
         else:
             # Check aggregation - should we create a new alert or aggregate?
             if self._should_aggregate(alert_key, rule):
-                logger.debug(f"Aggregating alert: {alert_key}")
+                logger.debug("Aggregating alert: %s", alert_key)
                 return None
             
             # Create new alert
@@ -578,20 +578,27 @@ class AlertManager:
     
     def get_alert_summary(self) -> Dict[str, Any]:
         """Get summary of alert status"""
-        summary = {
-            "active_count": len(self._active_alerts),
-            "critical_count": sum(1 for a in self._active_alerts.values() 
-                                 if a.rule.severity == AlertSeverity.CRITICAL),
-            "warning_count": sum(1 for a in self._active_alerts.values() 
-                               if a.rule.severity == AlertSeverity.WARNING),
-            "acknowledged_count": sum(1 for a in self._active_alerts.values() 
-                                     if a.acknowledged),
-            "by_device": defaultdict(int),
-            "by_type": defaultdict(int)
-        }
+        critical_count = warning_count = acknowledged_count = 0
+        by_device = defaultdict(int)
+        by_type = defaultdict(int)
         
+        # Single pass over the active alerts for every counter
         for alert in self._active_alerts.values():
-            summary["by_device"][alert.device_id] += 1
-            summary["by_type"][alert.rule.alert_type.value] += 1
-        
-        return dict(summary)
+            severity = alert.rule.severity
+            if severity == AlertSeverity.CRITICAL:
+                critical_count += 1
+            elif severity == AlertSeverity.WARNING:
+                warning_count += 1
+            if alert.acknowledged:
+                acknowledged_count += 1
+            by_device[alert.device_id] += 1
+            by_type[alert.rule.alert_type.value] += 1
+        
+        return {
+            "active_count": len(self._active_alerts),
+            "critical_count": critical_count,
+            "warning_count": warning_count,
+            "acknowledged_count": acknowledged_count,
+            "by_device": by_device,
+            "by_type": by_type
+        }
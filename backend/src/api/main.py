@@ -39,16 +39,18 @@ device_manager: Optional[MultiDXMManager] = None
 alert_manager: Optional[AlertManager] = None
 notifier: Optional[Notifier] = None
 config_manager: Optional[ConfigManager] = None
+session_factory = None  # Shared sessionmaker bound to the one engine/pool
 signal_processors: Dict[str, SignalProcessor] = {}
 defect_detectors: Dict[str, DefectDetector] = {}
 
 
 def get_db_session():
     """Database session dependency"""
-    if not config_manager:
+    if not config_manager or not session_factory:
         raise HTTPException(status_code=503, detail="System not initialized")
     
-    session_factory = get_session_factory(create_enhanced_engine(config_manager.config.database_url))
+    # Sessions borrow connections from the engine's pool instead of building
+    # a new engine (and opening a new SQLite connection) per request
     session = session_factory()
     try:
         yield session
@@ -66,7 +68,7 @@ async def verify_auth_token(token: str = None):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler"""
-    global device_manager, alert_manager, notifier, config_manager
+    global device_manager, alert_manager, notifier, config_manager, session_factory
     
     logger.info("🚀 Starting Railway Monitoring System...")
     
@@ -176,6 +178,7 @@ async def lifespan(app: FastAPI):
     await device_manager.stop()
     await alert_manager.stop()
     config_manager.stop_file_watching()
+    engine.dispose()
     logger.info("✅ Shutdown complete")
 
 
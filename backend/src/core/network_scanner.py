@@ -6,6 +6,8 @@ import asyncio
 import socket
 import struct
 import ipaddress
+from contextlib import suppress
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -15,6 +17,10 @@ import platform
 
 logger = logging.getLogger(__name__)
 
+# Modbus TCP read request: MBAP header (transaction, protocol, length, unit)
+# followed by the PDU (function code, start register, register count)
+_READ_REQUEST = struct.Struct('>HHHBBHH')
+
 @dataclass
 class NetworkDevice:
     """Discovered network device"""
@@ -122,7 +128,7 @@ class NetworkScanner:
                 return ip
             
         except Exception as e:
-            logger.debug(f"Ping error for {ip}: {e}")
+            logger.debug("Ping error for %s: %s", ip, e)
         
         return None
     
@@ -295,42 +301,73 @@ class ModbusDeviceScanner:
         if slave_ids is None:
             slave_ids = list(range(1, 247))  # Standard Modbus slave ID range
         
-        for slave_id in slave_ids:
-            try:
-                device = await self._probe_modbus_device(ip, self.modbus_port, slave_id)
+        port = self.modbus_port
+        writer = None
+        try:
+            for slave_id in slave_ids:
+                # One connection serves the whole slave ID sweep; it is only
+                # reopened after an I/O failure leaves the stream out of step
+                if writer is None:
+                    try:
+                        reader, writer = await asyncio.wait_for(
+                            asyncio.open_connection(ip, port),
+                            timeout=self.timeout
+                        )
+                    except (OSError, asyncio.TimeoutError) as e:
+                        logger.debug("Modbus connect failed for %s:%s - %s", ip, port, e)
+                        return None
+                
+                try:
+                    device = await self._probe_modbus_device(reader, writer, ip, port, slave_id)
+                except (OSError, asyncio.TimeoutError) as e:
+                    logger.debug("Failed to probe %s:%s - %s", ip, slave_id, e)
+                    await self._close_stream(writer)
+                    writer = None
+                    continue
+                
                 if device:
                     return device
-            except Exception as e:
-                logger.debug(f"Failed to probe {ip}:{slave_id} - {e}")
-                continue
+        finally:
+            if writer is not None:
+                await self._close_stream(writer)
         
         return None
     
-    async def _probe_modbus_device(self, ip: str, port: int, slave_id: int) -> Optional[ModbusDevice]:
-        """Probe a Modbus device for identification"""
-        try:
-            start_time = datetime.now()
-            
-            # Connect to Modbus device
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(ip, port),
-                timeout=self.timeout
-            )
-            
-            # Send Modbus request (Read Holding Registers)
-            request = self._build_modbus_request(slave_id, 40001, 10)
-            writer.write(request)
-            await writer.drain()
-            
-            # Read response
-            response = await asyncio.wait_for(
-                reader.read(1024),
-                timeout=self.timeout
-            )
-            
-            writer.close()
+    @staticmethod
+    async def _close_stream(writer: asyncio.StreamWriter) -> None:
+        """Close a probe connection, ignoring errors from a dead socket"""
+        writer.close()
+        with suppress(OSError):
             await writer.wait_closed()
-            
+    
+    async def _probe_modbus_device(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        ip: str,
+        port: int,
+        slave_id: int,
+    ) -> Optional[ModbusDevice]:
+        """Probe one slave ID over an open connection.
+        
+        I/O errors propagate so the caller can reopen the connection.
+        """
+        start_time = datetime.now()
+        
+        # Send Modbus request (Read Holding Registers)
+        request = self._build_modbus_request(slave_id, 40001, 10)
+        writer.write(request)
+        await writer.drain()
+        
+        # Read response
+        response = await asyncio.wait_for(
+            reader.read(1024),
+            timeout=self.timeout
+        )
+        if not response:
+            raise ConnectionResetError("connection closed by peer")
+        
+        try:
             # Parse response
             if len(response) >= 9:  # Minimum Modbus TCP response size
                 device_info = self._parse_modbus_response(response, slave_id)
@@ -352,11 +389,13 @@ class ModbusDeviceScanner:
                 )
             
         except Exception as e:
-            logger.debug(f"Modbus probe failed for {ip}:{port}:{slave_id} - {e}")
+            logger.debug("Modbus probe failed for %s:%s:%s - %s", ip, port, slave_id, e)
         
         return None
     
-    def _build_modbus_request(self, slave_id: int, start_address: int, quantity: int) -> bytes:
+    @staticmethod
+    @lru_cache(maxsize=256)  # one frame per slave ID probed; identical across IPs
+    def _build_modbus_request(slave_id: int, start_address: int, quantity: int) -> bytes:
         """Build Modbus TCP read holding registers request"""
         # Modbus TCP header
         transaction_id = 0x0001
@@ -369,7 +408,7 @@ class ModbusDeviceScanner:
         start_register = start_address - 40001  # Convert to 0-based
         register_count = quantity
         
-        request = struct.pack('>HHHHHBBHH', 
+        request = _READ_REQUEST.pack(
             transaction_id, protocol_id, length,
             unit_id, function_code, start_register, register_count)
         
@@ -389,14 +428,11 @@ class ModbusDeviceScanner:
                 return {}
             
             data = response[9:9 + byte_count]
-            registers = {}
             
-            # Parse register values
-            for i in range(0, min(byte_count, 20), 2):  # Limit to first 10 registers
-                if i + 1 < len(data):
-                    value = struct.unpack('>H', data[i:i+2])[0]
-                    register_addr = 40001 + (i // 2)
-                    registers[register_addr] = value
+            # Parse register values in one unpack (limit to first 10 registers)
+            count = min(byte_count, 20) // 2
+            values = struct.unpack_from(f'>{count}H', data)
+            registers = {40001 + i: value for i, value in enumerate(values)}
             
             # Try to identify device from register values
             device_info = {'registers': registers}
@@ -421,7 +457,7 @@ class ModbusDeviceScanner:
             return device_info
             
         except Exception as e:
-            logger.debug(f"Failed to parse Modbus response: {e}")
+            logger.debug("Failed to parse Modbus response: %s", e)
             return {}
     
     def _is_dxm_device(self, device_info: Dict[str, Any]) -> bool:
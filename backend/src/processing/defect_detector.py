@@ -34,9 +34,9 @@ class SeverityLevel(Enum):
     LEVEL_5 = 5  # Critical - stop operation
 
 
-@dataclass
+@dataclass(slots=True)
 class DefectSignature:
-    """Detected defect signature"""
+    """Detected defect signature (created per detection, so slotted)"""
     defect_type: DefectType
     confidence_score: float  # 0-100%
     severity_level: int  # 1-5
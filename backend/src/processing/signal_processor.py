@@ -3,6 +3,7 @@ Signal Processor - Advanced signal processing for vibration data.
 Includes speed normalization, temperature compensation, and rolling baseline.
 """
 import logging
+import math
 import numpy as np
 from typing import Dict, Any, Optional, List, Deque
 from collections import deque
@@ -144,7 +145,7 @@ class SignalProcessor:
         result["temp_trend"] = self._calculate_trend(self._temp_buffer)
         
         # Calculate overall metrics
-        result["overall_rms"] = round(np.sqrt(z_rms**2 + x_rms**2), 3)
+        result["overall_rms"] = round(math.hypot(z_rms, x_rms), 3)
         
         # Multi-parameter correlation
         result["correlation_metrics"] = self._calculate_correlations()
@@ -3,7 +3,7 @@ Enhanced Database Schema for Railway Rolling Stock Condition Monitoring System.
 Supports multi-DXM, defect detection, intelligent alerts, and event logging.
 """
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, 
+    create_engine, event, Column, Integer, String, Float, DateTime, Boolean, Text, 
     ForeignKey, Enum, JSON, Index, LargeBinary
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -86,9 +86,11 @@ class RawData(Base):
     """Raw sensor data from all devices (high-resolution logging)"""
     __tablename__ = "raw_data"
     
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(String, ForeignKey("devices.device_id"), nullable=False, index=True)
-    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
+    # Append-heavy table: only the composite/time indexes in __table_args__
+    # (id is the rowid already; device_id is their leading column)
+    id = Column(Integer, primary_key=True)
+    device_id = Column(String, ForeignKey("devices.device_id"), nullable=False)
+    timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     
     # Vibration data
     z_rms = Column(Float)
@@ -140,7 +142,7 @@ class ProcessedData(Base):
     """Processed and normalized sensor data"""
     __tablename__ = "processed_data"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     device_id = Column(String, ForeignKey("devices.device_id"), nullable=False, index=True)
     raw_data_id = Column(Integer, ForeignKey("raw_data.id"))
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
@@ -180,8 +182,8 @@ class DefectDetection(Base):
     """Defect detection results"""
     __tablename__ = "defect_detections"
     
-    id = Column(Integer, primary_key=True, index=True)
-    device_id = Column(String, ForeignKey("devices.device_id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    device_id = Column(String, ForeignKey("devices.device_id"), nullable=False)
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
     
     # Detection results
@@ -269,9 +271,9 @@ class Event(Base):
     """System and sensor events (high-resolution event logging)"""
     __tablename__ = "events"
     
-    id = Column(Integer, primary_key=True, index=True)
-    event_type = Column(String, nullable=False, index=True)  # anomaly, connection_change, threshold_breach
-    device_id = Column(String, ForeignKey("devices.device_id"), nullable=True, index=True)
+    id = Column(Integer, primary_key=True)
+    event_type = Column(String, nullable=False)  # anomaly, connection_change, threshold_breach
+    device_id = Column(String, ForeignKey("devices.device_id"), nullable=True)
     timestamp = Column(DateTime, default=lambda: datetime.now(timezone.utc), index=True)
     
     # Event details
@@ -448,9 +450,27 @@ def create_enhanced_engine(db_url: str = "sqlite:///./railway_monitoring.db"):
         pool_recycle=3600,
         echo=False
     )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _set_sqlite_pragmas)
     return engine
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Per-connection SQLite tuning for the append-heavy telemetry tables"""
+    cursor = dbapi_connection.cursor()
+    # WAL lets API reads run alongside the acquisition writes. NORMAL drops
+    # the per-commit fsync: a power cut may lose the last commits, but in WAL
+    # mode it cannot corrupt the database
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+    # Serve reads (history, exports) from mapped pages instead of copying
+    # them through the pager
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.close()
+
+
 def init_enhanced_db(engine):
     """Initialize all tables"""
     Base.metadata.create_all(bind=engine)
@@ -6,11 +6,21 @@ import sqlite3
 import logging
 from pathlib import Path
 from datetime import datetime
+from typing import Iterator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _iter_rows(cursor: sqlite3.Cursor, chunk_size: int = 1000) -> Iterator[tuple]:
+    """Yield rows from an executed cursor in fetchmany() chunks"""
+    while True:
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+        yield from rows
+
+
 class DatabaseMigration:
     """Handle database schema migration from v1 to v2"""
     
@@ -72,39 +82,40 @@ class DatabaseMigration:
             # Migrate thresholds to threshold_configs
             logger.info("Migrating thresholds...")
             old_cursor.execute("SELECT * FROM thresholds")
-            thresholds = old_cursor.fetchall()
             
-            for thresh in thresholds:
-                new_cursor.execute("""
-                    INSERT INTO threshold_configs (
-                        parameter, warning_high, critical_high, is_active, created_at, updated_at
-                    ) VALUES (?, ?, ?, 1, datetime('now'), datetime('now'))
-                """, (thresh[1], thresh[2], thresh[3]))
+            # One prepared statement bound to every row (executemany)
+            new_cursor.executemany("""
+                INSERT INTO threshold_configs (
+                    parameter, warning_high, critical_high, is_active, created_at, updated_at
+                ) VALUES (?, ?, ?, 1, datetime('now'), datetime('now'))
+            """, ((thresh[1], thresh[2], thresh[3]) for thresh in _iter_rows(old_cursor)))
+            threshold_count = new_cursor.rowcount
             
             # Migrate alerts
             logger.info("Migrating alerts...")
             old_cursor.execute("SELECT * FROM alerts")
-            alerts = old_cursor.fetchall()
             
-            for alert in alerts:
-                # Map old severity to new
-                severity_map = {"warning": "warning", "critical": "critical"}
-                severity = severity_map.get(alert[3], "warning")
-                
-                new_cursor.execute("""
-                    INSERT INTO alerts (
-                        alert_type, severity, status, title, message, parameter,
-                        current_value, threshold, acknowledged, acknowledged_by,
-                        acknowledged_at, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    alert[1], severity, "acknowledged" if alert[9] else "resolved",
+            # Map old severity to new
+            severity_map = {"warning": "warning", "critical": "critical"}
+            new_cursor.executemany("""
+                INSERT INTO alerts (
+                    alert_type, severity, status, title, message, parameter,
+                    current_value, threshold, acknowledged, acknowledged_by,
+                    acknowledged_at, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                (
+                    alert[1], severity_map.get(alert[3], "warning"),
+                    "acknowledged" if alert[9] else "resolved",
                     alert[4], alert[4], alert[5], alert[6], alert[7],
                     alert[9], alert[10], alert[11], alert[12]
-                ))
+                )
+                for alert in _iter_rows(old_cursor)
+            ))
+            alert_count = new_cursor.rowcount
             
             new_conn.commit()
-            logger.info(f"Migrated {len(thresholds)} thresholds and {len(alerts)} alerts")
+            logger.info(f"Migrated {threshold_count} thresholds and {alert_count} alerts")
             
         finally:
             old_conn.close()
@@ -127,8 +138,11 @@ class DatabaseMigration:
                 'data_exports', 'notification_configs'
             ]
             
+            # Same SQL text every time, so sqlite3 reuses the prepared statement
             for table in required_tables:
-                cursor.execute(f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table}'")
+                cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table,)
+                )
                 if not cursor.fetchone():
                     logger.error(f"Missing table: {table}")
                     return False
@@ -0,0 +1,61 @@
+from core.register_blocks import RegisterBlockOrder
+
+PRIMARY = 5200
+FALLBACK = 0
+
+
+def _demoted_order():
+    blocks = RegisterBlockOrder(PRIMARY, FALLBACK)
+    for _ in range(RegisterBlockOrder.DEMOTE_AFTER):
+        blocks.record(FALLBACK)
+    return blocks
+
+def test_primary_first_by_default():
+    blocks = RegisterBlockOrder(PRIMARY, FALLBACK)
+    assert blocks.order == (PRIMARY, FALLBACK)
+
+def test_single_fallback_hit_does_not_demote():
+    blocks = RegisterBlockOrder(PRIMARY, FALLBACK)
+    blocks.record(FALLBACK)
+    assert blocks.order == (PRIMARY, FALLBACK)
+
+def test_demotes_after_consecutive_fallback_hits():
+    blocks = RegisterBlockOrder(PRIMARY, FALLBACK)
+    for _ in range(RegisterBlockOrder.DEMOTE_AFTER - 1):
+        blocks.record(FALLBACK)
+        assert blocks.order == (PRIMARY, FALLBACK)
+    blocks.record(FALLBACK)
+    assert blocks.order == (FALLBACK, PRIMARY)
+
+def test_empty_poll_breaks_the_streak():
+    blocks = RegisterBlockOrder(PRIMARY, FALLBACK)
+    for _ in range(RegisterBlockOrder.DEMOTE_AFTER - 1):
+        blocks.record(FALLBACK)
+    blocks.record(None)
+    blocks.record(FALLBACK)
+    assert blocks.order == (PRIMARY, FALLBACK)
+
+def test_primary_hit_breaks_the_streak():
+    blocks = RegisterBlockOrder(PRIMARY, FALLBACK)
+    for _ in range(RegisterBlockOrder.DEMOTE_AFTER - 1):
+        blocks.record(FALLBACK)
+    blocks.record(PRIMARY)
+    blocks.record(FALLBACK)
+    assert blocks.order == (PRIMARY, FALLBACK)
+
+def test_reprobes_primary_while_demoted():
+    blocks = _demoted_order()
+    firsts = []
+    for _ in range(2 * RegisterBlockOrder.REPROBE_EVERY):
+        firsts.append(blocks.order[0])
+        blocks.record(FALLBACK)
+    probes = [i for i, addr in enumerate(firsts) if addr == PRIMARY]
+    assert len(probes) == 2
+    assert probes[1] - probes[0] == RegisterBlockOrder.REPROBE_EVERY
+
+def test_primary_data_repromotes():
+    blocks = _demoted_order()
+    blocks.record(PRIMARY)
+    assert blocks.order == (PRIMARY, FALLBACK)
+    blocks.record(FALLBACK)
+    assert blocks.order == (PRIMARY, FALLBACK)
@@ -14,7 +14,6 @@ from pymodbus.client import ModbusTcpClient
 import threading
 import time
 import datetime
-from collections import deque
 
 # ==============================================================================
 # 1. SYSTEM CONFIGURATION
@@ -57,6 +56,11 @@ REGS = [
     (20, "Device Status",   1.0,     "raw "),
 ]
 
+# Column views of REGS (entry i describes register i) for one-shot scaling
+REG_LABELS   = [r[1] for r in REGS]
+REG_DIVISORS = np.array([r[2] for r in REGS])
+REG_TEMP_IDX = REG_LABELS.index("Temperature")
+
 # KPI cards: (reg_label, display_name, bar_color, y_max)
 KPI_DEFS = [
     ("Z-RMS Velocity",  "Z-RMS Vel",    "#00f5ff", 10.0),
@@ -89,7 +93,7 @@ COLORS = {
     "hdr":    "#060a12",
 }
 
-POLL_INTERVAL = 1.0 / CONFIG["POLL_HZ"]
+POLL_PERIOD_NS = int(1e9 / CONFIG["POLL_HZ"])
 
 # ==============================================================================
 # 3. SHARED STATE
@@ -102,8 +106,10 @@ class SharedState:
         self.raw_regs  = [0] * 21
         self.scaled    = {r[1]: 0.0 for r in REGS}
         n = CONFIG["HIST_LEN"]
-        self.hist_z  = deque(maxlen=n)   # Z-RMS velocity  (fills from real data)
-        self.hist_x  = deque(maxlen=n)   # X-RMS velocity
+        # Preallocated ring buffer: row 0 = Z-RMS velocity, row 1 = X-RMS velocity.
+        # hist_i is the next slot to write; unwritten slots stay zero.
+        self.hist    = np.zeros((2, n))
+        self.hist_i  = 0
         self.n_real  = 0                 # polls received from device
         self._t0     = time.time()
 
@@ -117,6 +123,10 @@ def backend_worker():
     slave      = CONFIG["SLAVE"]
     print(f"[BACKEND] Connecting → {host}:{port}")
     client = ModbusTcpClient(host, port=port, timeout=CONFIG["TIMEOUT"])
+    next_ns = time.monotonic_ns()
+    # Scratch arrays reused by every poll
+    raw  = np.zeros(len(REGS))
+    vals = np.zeros(len(REGS))
 
     while True:
         try:
@@ -141,22 +151,25 @@ def backend_worker():
                 continue
 
             regs = list(rr.registers)
-            scaled = {}
-            for idx, label, div, unit in REGS:
-                raw = regs[idx] if idx < len(regs) else 0
-                val = raw / div
-                # signed 16-bit correction for temperature
-                if label == "Temperature" and raw > 32767:
-                    val = (raw - 65536) / div
-                scaled[label] = round(val, 4)
+            n = min(len(regs), len(REGS))
+            raw[:n] = regs[:n]
+            raw[n:] = 0
+            # signed 16-bit correction for temperature
+            if raw[REG_TEMP_IDX] > 32767:
+                raw[REG_TEMP_IDX] -= 65536
+            np.divide(raw, REG_DIVISORS, out=vals)
+            np.round(vals, 4, out=vals)
+            scaled = dict(zip(REG_LABELS, vals.tolist()))
 
             with STATE.lock:
                 STATE.connected = True
                 STATE.last_ts   = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
                 STATE.raw_regs  = regs
                 STATE.scaled    = scaled
-                STATE.hist_z.append(scaled.get("Z-RMS Velocity", 0.0))
-                STATE.hist_x.append(scaled.get("X-RMS Velocity", 0.0))
+                i = STATE.hist_i
+                STATE.hist[0, i] = scaled.get("Z-RMS Velocity", 0.0)
+                STATE.hist[1, i] = scaled.get("X-RMS Velocity", 0.0)
+                STATE.hist_i = (i + 1) % CONFIG["HIST_LEN"]
                 STATE.n_real   += 1
 
         except Exception as exc:
@@ -170,7 +183,14 @@ def backend_worker():
             time.sleep(2.0)
             client = ModbusTcpClient(host, port=port, timeout=CONFIG["TIMEOUT"])
 
-        time.sleep(POLL_INTERVAL)
+        # Pace against a monotonic deadline so read time doesn't stretch the
+        # period; after a stall, restart the schedule instead of bursting
+        next_ns += POLL_PERIOD_NS
+        now_ns = time.monotonic_ns()
+        if next_ns > now_ns:
+            time.sleep((next_ns - now_ns) / 1e9)
+        else:
+            next_ns = now_ns
 
 # ==============================================================================
 # 5. GUI
@@ -352,6 +372,8 @@ class GandivaUI:
         # Frequency axis for one-sided FFT
         N = CONFIG["FFT_LEN"]
         self._fft_freqs = np.fft.rfftfreq(N, d=1.0 / CONFIG["POLL_HZ"])[: N // 2]
+        # Hann window and amplitude scale are fixed for the session – build once
+        self._fft_win   = np.hanning(N) * (2.0 / N)
 
         # Placeholder line + dominant freq marker
         self.fft_line, = self.ax_fft.plot([], [],
@@ -381,8 +403,10 @@ class GandivaUI:
             ts        = STATE.last_ts
             raw_regs  = list(STATE.raw_regs)
             scaled    = dict(STATE.scaled)
-            hist_z    = np.array(STATE.hist_z, dtype=float)
-            hist_x    = np.array(STATE.hist_x, dtype=float)
+            # Oldest → newest; zeros on the left until the buffer has filled
+            i         = STATE.hist_i
+            hist_z, hist_x = np.concatenate(
+                (STATE.hist[:, i:], STATE.hist[:, :i]), axis=1)
             n_real    = STATE.n_real
 
         # ── Header ────────────────────────────────────────────
@@ -423,15 +447,11 @@ class GandivaUI:
         self.tree.tag_configure("zero",   foreground=COLORS["dim"])
 
         # ── Time-Domain chart ─────────────────────────────────
-        n_hist = CONFIG["HIST_LEN"]
-        if len(hist_z) > 0:
-            # Scroll right-to-left: pad left with zeros until buffer fills
-            z_pad = np.concatenate([np.zeros(max(0, n_hist - len(hist_z))), hist_z])
-            x_pad = np.concatenate([np.zeros(max(0, n_hist - len(hist_x))), hist_x])
-            xs = np.linspace(0, n_hist / CONFIG["POLL_HZ"], n_hist)
-            self.line_z.set_data(xs, z_pad)
-            self.line_x.set_data(xs, x_pad)
-            y_max = max(float(z_pad.max()), float(x_pad.max()), 0.5)
+        if n_real > 0:
+            # Scroll right-to-left; the x axis was fixed in _build_charts
+            self.line_z.set_ydata(hist_z)
+            self.line_x.set_ydata(hist_x)
+            y_max = max(float(hist_z.max()), float(hist_x.max()), 0.5)
             self.ax_td.set_ylim(0, y_max * 1.35)
 
         # ── FFT Spectrum ──────────────────────────────────────
@@ -440,13 +460,13 @@ class GandivaUI:
             self._fft_info.set_visible(False)
             # Z axis spectrum
             sig_z = hist_z[-N:] - hist_z[-N:].mean()
-            win   = np.hanning(N)
-            mag_z = np.abs(np.fft.rfft(sig_z * win)) * 2.0 / N
+            win   = self._fft_win
+            mag_z = np.abs(np.fft.rfft(sig_z * win))
             mag_z = mag_z[: N // 2]
 
             # X axis spectrum
             sig_x = hist_x[-N:] - hist_x[-N:].mean()
-            mag_x = np.abs(np.fft.rfft(sig_x * win)) * 2.0 / N
+            mag_x = np.abs(np.fft.rfft(sig_x * win))
             mag_x = mag_x[: N // 2]
 
             freqs = self._fft_freqs
@@ -31,6 +31,7 @@ import csv
 import logging
 import signal
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -100,6 +101,52 @@ def decode(regs: list[int]) -> dict | None:
     }
 
 
+# ---------------------------------------------------------------------------
+# Register block selection (mirrors backend/core/register_blocks.py; kept
+# local so this script runs standalone)
+# ---------------------------------------------------------------------------
+
+class RegisterBlockOrder:
+    """
+    Which register block (5200 primary, 0 fallback) to read first.
+
+    The primary is only demoted after DEMOTE_AFTER consecutive polls where
+    the fallback had data and the primary did not; while demoted it is
+    still tried first every REPROBE_EVERY polls.
+    """
+
+    DEMOTE_AFTER  = 3
+    REPROBE_EVERY = 50
+
+    def __init__(self, primary: int = 5200, fallback: int = 0) -> None:
+        self.primary  = primary
+        self.fallback = fallback
+        self._misses  = 0
+        self._demoted = False
+        self._polls_since_demotion = 0
+
+    @property
+    def order(self) -> tuple[int, int]:
+        if self._demoted and self._polls_since_demotion % self.REPROBE_EVERY:
+            return (self.fallback, self.primary)
+        return (self.primary, self.fallback)
+
+    def record(self, address: int | None) -> None:
+        """Record which block returned non-zero data this poll (None if neither)."""
+        if address == self.primary:
+            self._misses  = 0
+            self._demoted = False
+        elif address == self.fallback and not self._demoted:
+            self._misses += 1
+            if self._misses >= self.DEMOTE_AFTER:
+                self._demoted = True
+                self._polls_since_demotion = 0
+        elif address is None:
+            self._misses = 0
+        if self._demoted:
+            self._polls_since_demotion += 1
+
+
 # ---------------------------------------------------------------------------
 # Collection loop
 # ---------------------------------------------------------------------------
@@ -137,11 +184,11 @@ def collect(
     n_collected = 0
     n_errors    = 0
     start_time  = time.monotonic()
-    stop        = False
+    stop        = threading.Event()
+    block_order = RegisterBlockOrder()  # primary range first, fallback to 0
 
     def _on_sigint(sig, frame):            # allow clean Ctrl+C
-        nonlocal stop
-        stop = True
+        stop.set()
         print()
         log.info("Interrupted.")
 
@@ -163,16 +210,18 @@ def collect(
             existing = sum(1 for _ in open(output, encoding="utf-8")) - 1
             log.info("Appending to existing file (%d rows already present)", existing)
 
-        while not stop:
+        while not stop.is_set():
             # Check stop conditions
             if count    is not None and n_collected >= count:
                 break
             if duration is not None and (time.monotonic() - start_time) >= duration:
                 break
 
-            # Read registers — try primary address range first, fallback to 0
+            # Read registers — the preferred block first, then the other one,
+            # so each sample normally costs a single transaction
             raw = None
-            for addr in (5200, 0):
+            data_addr = None
+            for addr in block_order.order:
                 try:
                     result = client.read_holding_registers(
                         address=addr, count=22, slave=slave
@@ -180,10 +229,11 @@ def collect(
                     if not result.isError() and result.registers:
                         regs = list(result.registers)
                         if any(r != 0 for r in regs):
-                            raw = regs
+                            raw, data_addr = regs, addr
                             break
                 except Exception:
                     pass
+            block_order.record(data_addr)
 
             if raw:
                 data = decode(raw)
@@ -209,7 +259,8 @@ def collect(
                 if n_errors == 1 or n_errors % 20 == 0:
                     log.warning("Read error #%d — retrying …", n_errors)
 
-            time.sleep(interval)
+            # Sleeps for the interval, but Ctrl+C ends the wait immediately
+            stop.wait(interval)
 
     client.close()
     log.info(
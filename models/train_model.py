@@ -100,10 +100,13 @@ FEATURE_NAMES: list[str] = [
 # Register decoding
 # ---------------------------------------------------------------------------
 
-def _get_reg(registers: list[int], idx: int, div: float = 1.0) -> float:
-    if idx >= len(registers):
-        return 0.0
-    return registers[idx] / div
+# Divisor for each of the first 20 registers (R0..R19), in block order
+_REG_DIVISORS = np.array([
+    100.0, 1000.0, 1000.0, 100.0, 1000.0, 1000.0,   # R0-R5
+    1000.0, 1000.0, 10.0, 10.0,                     # R6-R9
+    1000.0, 1000.0, 1000.0, 1000.0, 1000.0, 1000.0, # R10-R15
+    1000.0, 1000.0, 1000.0, 1000.0,                 # R16-R19
+])
 
 
 def _signed(v: float) -> float:
@@ -115,32 +118,36 @@ def decode_registers(registers: list[int]) -> dict | None:
     if not registers or len(registers) < 20:
         return None
 
-    g = lambda idx, div=1.0: _get_reg(registers, idx, div)
+    # Scale the whole block in one numpy divide, then unpack plain floats
+    (r0, r1, r2, r3, r4, r5, r6, r7, r8, r9,
+     r10, r11, r12, r13, r14, r15, r16, r17, r18, r19) = (
+        np.asarray(registers[:20], dtype=np.float64) / _REG_DIVISORS
+    ).tolist()
 
-    z_rms = g(1, 1000.0)
-    x_rms = g(5, 1000.0)
+    z_rms = r1
+    x_rms = r5
 
     return {
-        "z_axis_rms":     round(g(0, 100.0),   4),
-        "z_rms":          round(z_rms,          3),
-        "iso_peak_peak":  round(g(2, 1000.0),   3),
-        "temperature":    round(_signed(g(3, 100.0)), 1),
-        "z_true_peak":    round(g(4, 1000.0),   3),
-        "x_rms":          round(x_rms,          3),
-        "z_accel":        round(g(6, 1000.0),   3),
-        "x_accel":        round(g(7, 1000.0),   3),
-        "frequency":      round(g(8, 10.0),     1),
-        "x_frequency":    round(g(9, 10.0),     1),
-        "z_band_rms":     round(g(10, 1000.0),  3),
-        "x_band_rms":     round(g(11, 1000.0),  3),
-        "kurtosis":       round(g(12, 1000.0),  3),
-        "x_kurtosis":     round(g(13, 1000.0),  3),
-        "crest_factor":   round(g(14, 1000.0),  3),
-        "x_crest_factor": round(g(15, 1000.0),  3),
-        "z_hf_rms_accel": round(g(16, 1000.0),  4),
-        "z_peak":         round(g(17, 1000.0),  3),
-        "x_hf_rms_accel": round(g(18, 1000.0),  4),
-        "x_peak":         round(g(19, 1000.0),  3),
+        "z_axis_rms":     round(r0,            4),
+        "z_rms":          round(z_rms,         3),
+        "iso_peak_peak":  round(r2,            3),
+        "temperature":    round(_signed(r3),   1),
+        "z_true_peak":    round(r4,            3),
+        "x_rms":          round(x_rms,         3),
+        "z_accel":        round(r6,            3),
+        "x_accel":        round(r7,            3),
+        "frequency":      round(r8,            1),
+        "x_frequency":    round(r9,            1),
+        "z_band_rms":     round(r10,           3),
+        "x_band_rms":     round(r11,           3),
+        "kurtosis":       round(r12,           3),
+        "x_kurtosis":     round(r13,           3),
+        "crest_factor":   round(r14,           3),
+        "x_crest_factor": round(r15,           3),
+        "z_hf_rms_accel": round(r16,           4),
+        "z_peak":         round(r17,           3),
+        "x_hf_rms_accel": round(r18,           4),
+        "x_peak":         round(r19,           3),
         "z_x_ratio":      round(z_rms / x_rms, 4) if x_rms > 0 else 0.0,
     }
 
@@ -180,6 +187,87 @@ def label_sample(d: dict) -> int:
 # Synthetic data generation
 # ---------------------------------------------------------------------------
 
+# Column order of the primary channels drawn per class
+_PRIMARY_CHANNELS = ("z_rms", "x_rms", "kurtosis", "crest", "temp", "z_accel", "x_accel", "freq")
+
+# Index of each parameter along the last axis of _SYNTH_PARAMS
+_P_MEAN, _P_STD, _P_LO, _P_HI = range(4)
+
+# (mean, std, low, high) for each primary channel, indexed [label, channel, param]
+_SYNTH_PARAMS = np.array([
+    [  # 0 Normal
+        (0.8, 0.4, 0.1, 2.7), (0.6, 0.3, 0.1, 2.0),
+        (2.5, 0.3, 1.0, 2.95), (2.4, 0.3, 1.5, 3.4),
+        (35, 5, 20, 54), (0.4, 0.15, 0.05, 1.2),
+        (0.3, 0.12, 0.05, 1.0), (50, 5, 38, 65),
+    ],
+    [  # 1 Warning
+        (4.0, 1.0, 2.8, 7.0), (2.8, 0.7, 1.5, 5.5),
+        (3.8, 0.5, 3.0, 4.9), (3.6, 0.5, 2.5, 4.9),
+        (52, 8, 35, 69), (1.8, 0.5, 0.6, 3.5),
+        (1.2, 0.4, 0.4, 2.8), (55, 8, 38, 72),
+    ],
+    [  # 2 Critical
+        (10.0, 2.5, 7.1, 18.0), (5.5, 1.8, 2.0, 13.0),
+        (3.0, 1.0, 1.5, 4.9), (3.0, 0.8, 2.0, 4.9),
+        (76, 8, 70, 95), (5.0, 1.5, 2.0, 10.0),
+        (3.0, 1.0, 1.0, 7.0), (60, 10, 38, 85),
+    ],
+    [  # 3 BearingFault
+        (4.5, 1.2, 1.5, 9.0), (3.2, 0.9, 1.0, 7.0),
+        (7.5, 1.5, 5.0, 14.0), (6.5, 1.5, 4.0, 12.0),
+        (57, 8, 35, 73), (3.2, 0.9, 1.0, 7.0),
+        (2.2, 0.7, 0.7, 5.0), (53, 7, 35, 72),
+    ],
+    [  # 4 Imbalance
+        (5.5, 1.2, 2.0, 9.0), (1.5, 0.3, 0.3, 2.4),
+        (2.8, 0.4, 1.5, 3.9), (3.2, 0.5, 2.0, 4.5),
+        (46, 6, 28, 62), (2.8, 0.7, 1.0, 5.0),
+        (0.9, 0.2, 0.2, 1.7), (48, 5, 36, 62),
+    ],
+], dtype=np.float32)
+_SYNTH_PARAMS.setflags(write=False)
+
+# Secondary channels: primary source column scaled by a U(low, high) multiplier
+#   (name, source, low, high)
+_SECONDARY_CHANNELS = (
+    ("z_peak",     0, 1.2,  2.5),
+    ("x_peak",     1, 1.2,  2.5),
+    ("x_freq",     7, 0.88, 1.12),
+    ("z_axis_rms", 0, 0.93, 1.07),
+    ("z_band_rms", 0, 0.55, 0.90),
+    ("x_band_rms", 1, 0.55, 0.90),
+    ("x_kurtosis", 2, 0.65, 1.35),
+    ("x_crest",    3, 0.65, 1.35),
+    ("z_hf",       5, 0.35, 0.70),
+    ("x_hf",       6, 0.35, 0.70),
+)
+_SEC_SRC = np.array([c[1] for c in _SECONDARY_CHANNELS])
+_SEC_LO  = np.array([c[2] for c in _SECONDARY_CHANNELS], dtype=np.float32)
+_SEC_HI  = np.array([c[3] for c in _SECONDARY_CHANNELS], dtype=np.float32)
+
+# Channels derived from z_peak rather than a primary: (iso_peak_peak, z_true_peak)
+_PEAK_LO = np.array([1.7,  0.88], dtype=np.float32)
+_PEAK_HI = np.array([2.3,  1.12], dtype=np.float32)
+
+# 10**decimals each synthetic feature is rounded to, in FEATURE_NAMES order
+_ROUND_SCALE = np.array(
+    [1e2 if name in ("temperature", "frequency", "x_frequency") else 1e4
+     for name in FEATURE_NAMES]
+)
+
+
+# The model is trained on float32 features (see train_and_save), so the
+# synthetic channels are drawn in float32 from the start.
+
+def _normal32(rng: np.random.Generator, mean, std, size) -> np.ndarray:
+    return mean + std * rng.standard_normal(size, dtype=np.float32)
+
+
+def _uniform32(rng: np.random.Generator, lo, hi, size) -> np.ndarray:
+    return lo + (hi - lo) * rng.random(size, dtype=np.float32)
+
+
 def generate_synthetic(
     n_per_class: "int | dict[int, int]" = DEFAULT_SYNTH,
     seed: int = 42,
@@ -198,99 +286,49 @@ def generate_synthetic(
 
     rng = np.random.default_rng(seed)
 
-    # (mean, std, low, high) for primary channels per class
-    cfgs: dict[int, dict] = {
-        0: dict(  # Normal
-            z_rms=(0.8, 0.4, 0.1, 2.7),  x_rms=(0.6, 0.3, 0.1, 2.0),
-            kurtosis=(2.5, 0.3, 1.0, 2.95), crest=(2.4, 0.3, 1.5, 3.4),
-            temp=(35, 5, 20, 54),  z_accel=(0.4, 0.15, 0.05, 1.2),
-            x_accel=(0.3, 0.12, 0.05, 1.0), freq=(50, 5, 38, 65),
-        ),
-        1: dict(  # Warning
-            z_rms=(4.0, 1.0, 2.8, 7.0),  x_rms=(2.8, 0.7, 1.5, 5.5),
-            kurtosis=(3.8, 0.5, 3.0, 4.9), crest=(3.6, 0.5, 2.5, 4.9),
-            temp=(52, 8, 35, 69),  z_accel=(1.8, 0.5, 0.6, 3.5),
-            x_accel=(1.2, 0.4, 0.4, 2.8), freq=(55, 8, 38, 72),
-        ),
-        2: dict(  # Critical
-            z_rms=(10.0, 2.5, 7.1, 18.0), x_rms=(5.5, 1.8, 2.0, 13.0),
-            kurtosis=(3.0, 1.0, 1.5, 4.9), crest=(3.0, 0.8, 2.0, 4.9),
-            temp=(76, 8, 70, 95),  z_accel=(5.0, 1.5, 2.0, 10.0),
-            x_accel=(3.0, 1.0, 1.0, 7.0), freq=(60, 10, 38, 85),
-        ),
-        3: dict(  # BearingFault
-            z_rms=(4.5, 1.2, 1.5, 9.0),  x_rms=(3.2, 0.9, 1.0, 7.0),
-            kurtosis=(7.5, 1.5, 5.0, 14.0), crest=(6.5, 1.5, 4.0, 12.0),
-            temp=(57, 8, 35, 73),  z_accel=(3.2, 0.9, 1.0, 7.0),
-            x_accel=(2.2, 0.7, 0.7, 5.0), freq=(53, 7, 35, 72),
-        ),
-        4: dict(  # Imbalance
-            z_rms=(5.5, 1.2, 2.0, 9.0),  x_rms=(1.5, 0.3, 0.3, 2.4),
-            kurtosis=(2.8, 0.4, 1.5, 3.9), crest=(3.2, 0.5, 2.0, 4.5),
-            temp=(46, 6, 28, 62),  z_accel=(2.8, 0.7, 1.0, 5.0),
-            x_accel=(0.9, 0.2, 0.2, 1.7), freq=(48, 5, 36, 62),
-        ),
-    }
+    labels = np.repeat(
+        np.fromiter(CLASS_NAMES, dtype=np.intp),
+        [counts.get(lbl, 0) for lbl in CLASS_NAMES],
+    )
+    n = len(labels)
+    if n == 0:
+        return []
 
-    def bounded(mean, std, lo, hi, n=1):
-        return np.clip(rng.normal(mean, std, n), lo, hi)
+    # One batch across all classes: each row picks up its class's
+    # (mean, std, lo, hi) parameters, then every primary channel is drawn
+    # in a single (n, 8) normal draw bounded by a single clip.
+    p = _SYNTH_PARAMS[labels]
+    primary = np.clip(
+        _normal32(rng, p[..., _P_MEAN], p[..., _P_STD], (n, len(_PRIMARY_CHANNELS))),
+        p[..., _P_LO], p[..., _P_HI],
+    )
+    z_rms, x_rms, kurtosis, crest, temp, z_accel, x_accel, freq = primary.T
+
+    # Secondary channels derived from primary with noise – one gather
+    # and one multiply over the _SECONDARY_CHANNELS table
+    secondary = primary[:, _SEC_SRC] * _uniform32(rng, _SEC_LO, _SEC_HI, (n, len(_SEC_SRC)))
+    (z_peak, x_peak, x_freq, z_axis_rms, z_band_rms, x_band_rms,
+     x_kurtosis, x_crest, z_hf, x_hf) = secondary.T
+    iso_peak_peak, z_true_peak = (
+        z_peak[:, None] * _uniform32(rng, _PEAK_LO, _PEAK_HI, (n, 2))
+    ).T
+    z_x_ratio = np.where(x_rms > 0, z_rms / x_rms, np.float32(0.0))
+
+    # Columns in FEATURE_NAMES order, rounded in bulk
+    features = np.column_stack([
+        z_axis_rms, z_rms, iso_peak_peak, temp, z_true_peak, x_rms,
+        z_accel, x_accel, freq, x_freq, z_band_rms, x_band_rms,
+        kurtosis, x_kurtosis, crest, x_crest, z_hf, z_peak, x_hf, x_peak,
+        z_x_ratio,
+    ]).astype(np.float64)
+    features = np.round(features * _ROUND_SCALE) / _ROUND_SCALE
 
     samples: list[dict] = []
-    for label, c in cfgs.items():
-        n = counts.get(label, 0)
-        if n == 0:
-            continue
-        for _ in range(n):
-            z_rms     = float(bounded(*c["z_rms"])[0])
-            x_rms     = float(bounded(*c["x_rms"])[0])
-            kurtosis  = float(bounded(*c["kurtosis"])[0])
-            crest     = float(bounded(*c["crest"])[0])
-            temp      = float(bounded(*c["temp"])[0])
-            z_accel   = float(bounded(*c["z_accel"])[0])
-            x_accel   = float(bounded(*c["x_accel"])[0])
-            freq      = float(bounded(*c["freq"])[0])
-
-            # Secondary channels derived from primary with noise
-            z_peak         = z_rms * float(rng.uniform(1.2, 2.5))
-            x_peak         = x_rms * float(rng.uniform(1.2, 2.5))
-            x_freq         = freq * float(rng.uniform(0.88, 1.12))
-            z_axis_rms     = z_rms * float(rng.uniform(0.93, 1.07))
-            iso_peak_peak  = z_peak * float(rng.uniform(1.7, 2.3))
-            z_true_peak    = z_peak * float(rng.uniform(0.88, 1.12))
-            z_band_rms     = z_rms * float(rng.uniform(0.55, 0.90))
-            x_band_rms     = x_rms * float(rng.uniform(0.55, 0.90))
-            x_kurtosis     = kurtosis * float(rng.uniform(0.65, 1.35))
-            x_crest        = crest * float(rng.uniform(0.65, 1.35))
-            z_hf           = z_accel * float(rng.uniform(0.35, 0.70))
-            x_hf           = x_accel * float(rng.uniform(0.35, 0.70))
-            z_x_ratio      = z_rms / x_rms if x_rms > 0 else 0.0
-
-            row = dict(
-                z_axis_rms    = round(z_axis_rms,   4),
-                z_rms         = round(z_rms,         4),
-                iso_peak_peak = round(iso_peak_peak, 4),
-                temperature   = round(temp,          2),
-                z_true_peak   = round(z_true_peak,   4),
-                x_rms         = round(x_rms,         4),
-                z_accel       = round(z_accel,        4),
-                x_accel       = round(x_accel,        4),
-                frequency     = round(freq,           2),
-                x_frequency   = round(x_freq,         2),
-                z_band_rms    = round(z_band_rms,     4),
-                x_band_rms    = round(x_band_rms,     4),
-                kurtosis      = round(kurtosis,       4),
-                x_kurtosis    = round(x_kurtosis,     4),
-                crest_factor  = round(crest,          4),
-                x_crest_factor= round(x_crest,        4),
-                z_hf_rms_accel= round(z_hf,           4),
-                z_peak        = round(z_peak,         4),
-                x_hf_rms_accel= round(x_hf,           4),
-                x_peak        = round(x_peak,         4),
-                z_x_ratio     = round(z_x_ratio,      4),
-                label         = label,
-                source        = "synthetic",
-            )
-            samples.append(row)
+    for values, label in zip(features.tolist(), labels.tolist()):
+        row = dict(zip(FEATURE_NAMES, values))
+        row["label"]  = label
+        row["source"] = "synthetic"
+        samples.append(row)
 
     return samples
 
@@ -333,6 +371,52 @@ def load_real_data(csv_path: Path) -> list[dict]:
     return samples
 
 
+# ---------------------------------------------------------------------------
+# Register block selection (mirrors backend/core/register_blocks.py; kept
+# local so this script runs standalone)
+# ---------------------------------------------------------------------------
+
+class RegisterBlockOrder:
+    """
+    Which register block (5200 primary, 0 fallback) to read first.
+
+    The primary is only demoted after DEMOTE_AFTER consecutive polls where
+    the fallback had data and the primary did not; while demoted it is
+    still tried first every REPROBE_EVERY polls.
+    """
+
+    DEMOTE_AFTER  = 3
+    REPROBE_EVERY = 50
+
+    def __init__(self, primary: int = 5200, fallback: int = 0) -> None:
+        self.primary  = primary
+        self.fallback = fallback
+        self._misses  = 0
+        self._demoted = False
+        self._polls_since_demotion = 0
+
+    @property
+    def order(self) -> tuple[int, int]:
+        if self._demoted and self._polls_since_demotion % self.REPROBE_EVERY:
+            return (self.fallback, self.primary)
+        return (self.primary, self.fallback)
+
+    def record(self, address: int | None) -> None:
+        """Record which block returned non-zero data this poll (None if neither)."""
+        if address == self.primary:
+            self._misses  = 0
+            self._demoted = False
+        elif address == self.fallback and not self._demoted:
+            self._misses += 1
+            if self._misses >= self.DEMOTE_AFTER:
+                self._demoted = True
+                self._polls_since_demotion = 0
+        elif address is None:
+            self._misses = 0
+        if self._demoted:
+            self._polls_since_demotion += 1
+
+
 # ---------------------------------------------------------------------------
 # Live Modbus data collection
 # ---------------------------------------------------------------------------
@@ -362,18 +446,23 @@ def collect_live_data(
 
     log.info("Connected. Collecting %d samples …", n_samples)
     samples: list[dict] = []
+    block_order = RegisterBlockOrder()  # primary range first, fallback to 0
     try:
         for i in range(n_samples):
+            # The preferred block goes first, so each sample normally costs
+            # one transaction (one RTU silent interval)
             raw = None
-            for addr in (5200, 0):          # try primary range, then fallback
+            data_addr = None
+            for addr in block_order.order:
                 result = client.read_holding_registers(
                     address=addr, count=22, slave=slave
                 )
                 if not result.isError() and result.registers:
                     regs = result.registers
                     if any(r != 0 for r in regs):
-                        raw = regs
+                        raw, data_addr = regs, addr
                         break
+            block_order.record(data_addr)
 
             if raw:
                 data = decode_registers(list(raw))
@@ -407,8 +496,9 @@ def train_and_save(
     """Train a RandomForestClassifier, evaluate it, and persist the artefacts."""
 
     df = pd.DataFrame(samples)
-    X  = df[FEATURE_NAMES].values.astype(np.float32)
-    y  = df["label"].values.astype(int)
+    # Convert straight to the target dtypes – no intermediate float64 copy
+    X  = df[FEATURE_NAMES].to_numpy(dtype=np.float32)
+    y  = df["label"].to_numpy(dtype=int)
 
     # ---- Source breakdown ------------------------------------------------
     real_count  = int((df.get("source", pd.Series()) == "real").sum()) if "source" in df.columns else 0
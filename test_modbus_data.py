@@ -13,6 +13,9 @@ HOST = "192.168.0.1"
 PORT = 502
 SLAVE_ID = 1
 
+_WORD_PAIR_BE = struct.Struct('>HH')
+_FLOAT32_BE = struct.Struct('>f')
+
 try:
     from pymodbus.client import AsyncModbusTcpClient
 except ImportError:
@@ -23,7 +26,7 @@ except ImportError:
 def decode_float32_be(high: int, low: int) -> float:
     """Decode two 16-bit registers as a big-endian IEEE 754 float32."""
     try:
-        return struct.unpack('>f', struct.pack('>HH', high, low))[0]
+        return _FLOAT32_BE.unpack(_WORD_PAIR_BE.pack(high, low))[0]
     except Exception:
         return 0.0
 
@@ -31,7 +34,7 @@ def decode_float32_be(high: int, low: int) -> float:
 def decode_float32_le(low: int, high: int) -> float:
     """Decode two 16-bit registers as a little-endian word-swap float32."""
     try:
-        return struct.unpack('>f', struct.pack('>HH', high, low))[0]
+        return _FLOAT32_BE.unpack(_WORD_PAIR_BE.pack(high, low))[0]
     except Exception:
         return 0.0
 